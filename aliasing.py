@@ -0,0 +1,74 @@
+import numpy as np
+
+
+def alias_frequency(frequency, sampling_frequency):
+    """
+    Frequency a sinusoid appears at after sampling
+
+    A component at f sampled at fs folds onto |f - k * fs| for the integer k
+    nearest to f / fs, which always lies in [0, fs / 2]. Both arguments broadcast,
+    so a column of sampling frequencies against a row of component frequencies
+    gives the whole alias table of a sweep in one call.
+
+    Args:
+        frequency (float or array-like): Component frequencies in Hz
+        sampling_frequency (float or array-like): Sampling frequencies in Hz
+
+    Returns:
+        float or ndarray: Alias frequencies in Hz
+    """
+    frequency = np.abs(np.asarray(frequency, dtype=float))
+    sampling_frequency = np.asarray(sampling_frequency, dtype=float)
+    return np.abs(frequency - sampling_frequency * np.round(frequency / sampling_frequency))
+
+
+def is_aliased(frequency, sampling_frequency):
+    """True where a component violates the Nyquist criterion (fs <= 2f); broadcasts like alias_frequency."""
+    return 2 * np.abs(np.asarray(frequency, dtype=float)) >= np.asarray(sampling_frequency, dtype=float)
+
+
+def aliasing_report(frequencies, sampling_frequency, names=None):
+    """
+    Nyquist check of a set of components at one sampling frequency
+
+    Args:
+        frequencies (array-like): Component frequencies in Hz
+        sampling_frequency (float): Sampling frequency in Hz
+        names (list): Optional component names, in the same order
+
+    Returns:
+        dict: nyquist_rate (twice the highest frequency), aliased (True if any
+            component folds) and components, a list of dicts with name, frequency,
+            alias and aliased
+    """
+    frequencies = np.abs(np.asarray(frequencies, dtype=float))
+    if names is None:
+        names = [f"{frequency:g} Hz" for frequency in frequencies]
+    aliases = alias_frequency(frequencies, sampling_frequency)
+    aliased = is_aliased(frequencies, sampling_frequency)
+
+    return {
+        "nyquist_rate": 2 * float(frequencies.max()) if len(frequencies) else 0.0,
+        "aliased": bool(aliased.any()),
+        "components": [
+            {"name": name, "frequency": float(frequency), "alias": float(alias), "aliased": bool(flag)}
+            for name, frequency, alias, flag in zip(names, frequencies, aliases, aliased)
+        ],
+    }
+
+
+def sweep_aliasing(frequencies, sampling_frequencies):
+    """
+    Alias table of a set of components over many sampling frequencies
+
+    Args:
+        frequencies (array-like): Component frequencies in Hz
+        sampling_frequencies (array-like): Sampling frequencies in Hz
+
+    Returns:
+        tuple: Alias frequencies and Nyquist violation flags, both shaped
+            (len(sampling_frequencies), len(frequencies))
+    """
+    frequencies = np.asarray(frequencies, dtype=float)[np.newaxis, :]
+    sampling_frequencies = np.asarray(sampling_frequencies, dtype=float)[:, np.newaxis]
+    return alias_frequency(frequencies, sampling_frequencies), is_aliased(frequencies, sampling_frequencies)
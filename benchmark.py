@@ -0,0 +1,385 @@
+"""
+Benchmarks for the sampling -> reconstruction -> difference -> spectrum pipeline
+
+Run with:
+    python benchmark.py                          # full matrix, JSON on stdout
+    python benchmark.py --quick -o bench.json    # small matrix, JSON written to a file
+    python benchmark.py --suite hold             # vectorized hold family vs the legacy loop
+    python benchmark.py --suite lanczos          # Lanczos kernels vs sinc and cubic
+    python benchmark.py --suite startup          # cold start of the GUI, JSON on stdout
+
+The pipeline suite runs the same numeric code the GUI runs on its worker thread,
+without a display, for every combination of signal length, sampling frequency and
+component count. Each record holds the best wall time, the throughput and the
+peak memory allocated by the stage, so results can be diffed across releases.
+
+The startup suite launches the GUI in fresh interpreters and records when the
+first frame is painted and when the default signal's pipeline result is drawn,
+against STARTUP_TARGET_SECONDS. Without a display it runs on the offscreen Qt
+platform.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import pipeline
+import reconstruction
+from lod import MinMaxPyramid
+from noise import NoiseGenerator
+from spectrum import compute_spectrum, two_sided
+from timebase import UniformTimeBase
+
+
+# Version of the JSON layout, bumped whenever records change shape
+BENCHMARK_SCHEMA_VERSION = 1
+
+FULL_MATRIX = {
+    "lengths": [1_500, 15_000, 150_000, 1_500_000, 10_000_000],
+    "sampling_frequencies": [2, 20, 100, 1000],
+    "component_counts": [1, 10, 100],
+}
+QUICK_MATRIX = {
+    "lengths": [1_500, 150_000],
+    "sampling_frequencies": [20, 100],
+    "component_counts": [1, 10],
+}
+
+
+# Cold-start budget from interpreter start to the first painted frame
+STARTUP_TARGET_SECONDS = 1.0
+
+# Modules that must not be loaded before the first frame
+LAZY_MODULES = ("pandas", "scipy.fft", "scipy.interpolate", "scipy.signal")
+
+# Runs in a fresh interpreter from the source directory and prints its marks as JSON,
+# in seconds since the probe started
+STARTUP_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import task2
+marks = {"import": time.perf_counter()}
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and "first_frame" not in marks:
+            marks["first_frame"] = time.perf_counter()
+            marks["loaded_at_first_frame"] = [name for name in %r if name in sys.modules]
+        return False
+
+
+apply_recompute_result = task2.GUI.apply_recompute_result
+
+
+def timed_apply(self, result):
+    apply_recompute_result(self, result)
+    marks.setdefault("first_result", time.perf_counter())
+
+
+task2.GUI.apply_recompute_result = timed_apply
+window = task2.GUI()
+marks["construct"] = time.perf_counter()
+paint_filter = FirstPaint()
+window.installEventFilter(paint_filter)
+window.show()
+deadline = time.perf_counter() + %r
+while "first_result" not in marks and time.perf_counter() < deadline:
+    app.processEvents()
+    time.sleep(0.001)
+window.close()
+app.processEvents()
+print(json.dumps({key: value - start if isinstance(value, float) else value for key, value in marks.items()}))
+"""
+
+STARTUP_MARKS = ("import", "construct", "first_frame", "first_result", "process")
+
+
+def legacy_zero_order_hold(x_known, y_known, x_interp):
+    """The original per-sample mask loop, kept as the baseline for the ZOH benchmark."""
+    y_interp = np.zeros_like(x_interp)
+    for i in range(len(x_known) - 1):
+        mask = (x_interp >= x_known[i]) & (x_interp < x_known[i + 1])
+        y_interp[mask] = y_known[i]
+    y_interp[x_interp >= x_known[-1]] = y_known[-1]
+    return y_interp
+
+
+def time_call(func, repeat=5):
+    """Return the best wall time of func() in seconds."""
+    number = 1
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def peak_memory(func):
+    """Return the peak number of bytes allocated while func() runs."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def make_signal(length, components, duration=6.0, max_frequency=20.0):
+    """
+    Sum of cosines on a uniform time base, like the signals composed in the GUI
+
+    Args:
+        length (int): Number of points of the time base
+        components (int): Number of cosine components
+        duration (float): Length of the signal in seconds
+        max_frequency (float): Frequency of the highest component in Hz
+
+    Returns:
+        tuple: Time base (a UniformTimeBase) and amplitude
+    """
+    time_base = UniformTimeBase.linspace(0, duration, length)
+    instants = np.asarray(time_base)
+    frequencies = np.linspace(1, max_frequency, components)
+    phases = np.linspace(0, np.pi, components)
+    amplitude = np.zeros(length)
+    for frequency, phase in zip(frequencies, phases):
+        amplitude += np.cos(2 * np.pi * frequency * instants + phase) / components
+    return time_base, amplitude
+
+
+def benchmark_pipeline(lengths, sampling_frequencies, component_counts, methods=None, repeat=3, snr=40,
+                       measure_memory=True, progress=None):
+    """
+    Time every pipeline stage over a matrix of signal sizes
+
+    Args:
+        lengths (list): Signal lengths in points
+        sampling_frequencies (list): Sampling frequencies in Hz
+        component_counts (list): Numbers of cosine components
+        methods (list): Reconstruction methods, defaults to every registered one
+        repeat (int): Repetitions per stage; the best time is kept. Signals of a
+            million points or more are only timed once
+        snr (float): Signal-to-noise ratio of the added noise in dB
+        measure_memory (bool): Also record the peak allocation of every stage
+        progress (callable): Called with a short description before each case
+
+    Returns:
+        list: One dict per (length, sampling_frequency, components, stage, method)
+            with seconds, points (output size), throughput (points per second)
+            and peak_bytes (None when memory is not measured)
+    """
+    methods = reconstruction.available_methods() if methods is None else methods
+    noise = NoiseGenerator(seed=0)
+    records = []
+
+    def record(case, stage, func, points, method=None):
+        runs = 1 if case["length"] >= 1_000_000 else repeat
+        seconds = time_call(func, repeat=runs)
+        records.append({
+            **case,
+            "stage": stage,
+            "method": method,
+            "seconds": seconds,
+            "points": points,
+            "throughput": points / seconds if seconds > 0 else None,
+            "peak_bytes": peak_memory(func) if measure_memory else None,
+        })
+
+    for length in lengths:
+        for components in component_counts:
+            time_base, clean = make_signal(length, components)
+            signal_power = float(np.mean(clean ** 2))
+
+            # Signal-level stages do not depend on the sampling frequency
+            case = {"length": length, "sampling_frequency": None, "components": components}
+            if progress is not None:
+                progress(f"length={length} components={components}")
+            record(case, "noise", lambda: noise.add_noise(clean, snr, signal_power), length)
+            record(case, "spectrum", lambda: two_sided(*compute_spectrum(clean, time_base.step)),
+                   length)
+            record(case, "bandwidth", lambda: pipeline.signal_bandwidth(clean, time_base), length)
+            noisy = noise.add_noise(clean, snr, signal_power)
+
+            for fs in sampling_frequencies:
+                case = {"length": length, "sampling_frequency": fs, "components": components}
+                if progress is not None:
+                    progress(f"length={length} components={components} fs={fs}")
+                samples, sampled_amplitude = pipeline.take_samples(time_base, noisy, fs)
+                record(case, "samples", lambda: pipeline.take_samples(time_base, noisy, fs), len(samples))
+
+                grid = pipeline.output_grid(time_base, samples)
+                out_t = time_base[grid]
+                for method in methods:
+                    if len(samples) < reconstruction.MIN_SAMPLES[method]:
+                        continue
+                    record(case, "reconstruction",
+                           lambda: reconstruction.reconstruct(samples, sampled_amplitude, out_t=out_t, method=method),
+                           len(out_t), method=method)
+
+                # Difference and its level-of-detail pyramid, the work behind the Difference Viewer
+                _, reconstructed = reconstruction.reconstruct(samples, sampled_amplitude, out_t=out_t,
+                                                              method="Linear")
+                record(case, "difference", lambda: clean[grid] - reconstructed, len(out_t))
+                difference = clean[grid] - reconstructed
+                record(case, "lod", lambda: MinMaxPyramid(out_t, difference), len(out_t))
+    return records
+
+
+def benchmark_startup(runs=5, timeout=60):
+    """
+    Measure the cold start of the GUI, each run in a fresh interpreter
+
+    Args:
+        runs (int): Number of launches; the best time of every mark is kept
+        timeout (float): Seconds to wait for the default signal's pipeline result
+
+    Returns:
+        dict: runs (the marks of every launch: import, construct, first_frame,
+            first_result and process, the wall time of the whole launch, plus the
+            lazily imported modules that were already loaded at the first frame),
+            best, target_seconds and within_target (first frame within the target)
+    """
+    env = dict(os.environ)
+    if not (env.get("DISPLAY") or env.get("WAYLAND_DISPLAY")):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    code = STARTUP_PROBE % (LAZY_MODULES, timeout)
+    results = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                   env=env, capture_output=True, text=True, timeout=timeout + 30, check=True)
+        marks = json.loads(completed.stdout.strip().splitlines()[-1])
+        marks["process"] = time.perf_counter() - started
+        results.append(marks)
+
+    best = {}
+    for mark in STARTUP_MARKS:
+        values = [marks[mark] for marks in results if mark in marks]
+        if values:
+            best[mark] = min(values)
+    return {
+        "runs": results,
+        "best": best,
+        "target_seconds": STARTUP_TARGET_SECONDS,
+        "within_target": best.get("first_frame", float("inf")) <= STARTUP_TARGET_SECONDS,
+    }
+
+
+def git_revision():
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    """Describe the machine and library versions a benchmark ran with."""
+    import scipy
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "revision": git_revision(),
+    }
+
+
+def benchmark_zero_order_hold(sampling_frequencies=(2, 10, 100, 1000), duration=6, num_points=1500):
+    """Compare the vectorized hold family against the legacy ZOH loop."""
+    print(f"{'fs (Hz)':>8} {'samples':>8} {'legacy (ms)':>12} {'ZOH (ms)':>10} {'FOH (ms)':>10} {'speed-up':>9}")
+    x_interp = np.linspace(0, duration, num_points)
+    for fs in sampling_frequencies:
+        x_known = np.arange(0, duration, 1 / fs)
+        y_known = np.cos(2 * np.pi * 2 * x_known)
+        x_out = np.linspace(x_known.min(), x_known.max(), num_points)
+
+        expected = legacy_zero_order_hold(x_known, y_known, x_out)
+        actual = reconstruction.zero_order_hold(x_known, y_known, x_out)
+        assert np.array_equal(expected, actual), "Vectorized ZOH does not match the legacy loop"
+
+        legacy = time_call(lambda: legacy_zero_order_hold(x_known, y_known, x_out))
+        zoh = time_call(lambda: reconstruction.zero_order_hold(x_known, y_known, x_out))
+        foh = time_call(lambda: reconstruction.first_order_hold(x_known, y_known, x_interp))
+        print(f"{fs:>8} {len(x_known):>8} {legacy * 1e3:>12.3f} {zoh * 1e3:>10.3f} {foh * 1e3:>10.3f} "
+              f"{legacy / zoh:>8.1f}x")
+
+
+def benchmark_lanczos(output_lengths=(1_500, 15_000, 150_000, 1_500_000), fs=100, duration=6):
+    """Compare the table-driven Lanczos kernels with the sinc and cubic spline paths over output length."""
+    methods = [f"Lanczos (a={a})" for a in reconstruction.LANCZOS_ORDERS] + ["Sinc", "cubic"]
+    x_known = np.arange(0, duration, 1 / fs)
+    y_known = np.cos(2 * np.pi * 2 * x_known)
+    print(f"{'outputs':>10} " + " ".join(f"{method + ' (ms)':>18}" for method in methods))
+    for num_points in output_lengths:
+        x_out = np.linspace(x_known.min(), x_known.max(), num_points)
+        times = [time_call(lambda: reconstruction.reconstruct(x_known, y_known, out_t=x_out, method=method),
+                           repeat=3)
+                 for method in methods]
+        print(f"{num_points:>10} " + " ".join(f"{seconds * 1e3:>18.3f}" for seconds in times))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the signal processing pipeline.")
+    parser.add_argument("--suite", choices=["pipeline", "hold", "lanczos", "startup"], default="pipeline")
+    parser.add_argument("--quick", action="store_true", help="Use a small matrix for a fast sanity run")
+    parser.add_argument("--lengths", type=int, nargs="+", help="Signal lengths in points")
+    parser.add_argument("--fs", type=float, nargs="+", help="Sampling frequencies in Hz")
+    parser.add_argument("--components", type=int, nargs="+", help="Numbers of signal components")
+    parser.add_argument("--methods", nargs="+", help="Reconstruction methods (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Repetitions per stage (launches for the startup suite), the best time is kept")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory measurement")
+    parser.add_argument("-o", "--output", help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.suite == "hold":
+        benchmark_zero_order_hold()
+        return
+    if args.suite == "lanczos":
+        benchmark_lanczos()
+        return
+
+    started = time.time()
+    if args.suite == "startup":
+        records = benchmark_startup(runs=args.repeat)
+    else:
+        matrix = QUICK_MATRIX if args.quick else FULL_MATRIX
+        records = benchmark_pipeline(
+            args.lengths or matrix["lengths"],
+            args.fs or matrix["sampling_frequencies"],
+            args.components or matrix["component_counts"],
+            methods=args.methods,
+            repeat=args.repeat,
+            measure_memory=not args.no_memory,
+            progress=lambda message: print(message, file=sys.stderr),
+        )
+    report = {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "suite": args.suite,
+        "started": started,
+        "duration": time.time() - started,
+        "environment": environment(),
+        "results": records,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
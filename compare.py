@@ -0,0 +1,150 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+
+import reconstruction
+from shared_buffers import SharedArray
+from timebase import UniformTimeBase
+
+
+def reconstruct_into(method, row, count, samples_t_spec, samples_y_spec, out_t, out_y_spec):
+    """
+    Run one reconstruction in a worker, reading and writing shared-memory arrays
+
+    Args:
+        method (str): Name of a registered reconstruction method
+        row (int): Row of the output array the result is written to
+        count (int): Number of leading output instants to reconstruct
+        samples_t_spec, samples_y_spec (tuple): Specs of the sample arrays
+        out_t (tuple or UniformTimeBase): Spec of the output instants, or a uniform
+            time base, which is passed by value
+        out_y_spec (tuple): Spec of the (methods, len(out_t)) output array
+
+    Returns:
+        str: The error message if the method could not run, else None
+    """
+    specs = [samples_t_spec, samples_y_spec, out_y_spec]
+    if not isinstance(out_t, UniformTimeBase):
+        specs.append(out_t)
+    arrays = [SharedArray.attach(spec) for spec in specs]
+    samples_t, samples_y, out_y = (shared.array for shared in arrays[:3])
+    if len(arrays) > 3:
+        out_t = arrays[3].array
+    try:
+        out_y[row] = reconstruction.reconstruct(samples_t, samples_y, out_t=out_t[:count], method=method)[1]
+        return None
+    except ValueError as e:
+        out_y[row] = np.nan
+        return str(e)
+    finally:
+        del samples_t, samples_y, out_t, out_y
+        for shared in arrays:
+            shared.close()
+
+
+class MethodComparison:
+    """
+    Run every reconstruction method on the same samples concurrently
+
+    Each method runs in its own worker process, so the wall time is about that of
+    the slowest method rather than the sum. Inputs that already live in the shared
+    buffer store are handed to the workers by name and a UniformTimeBase by value;
+    any other input is copied into shared memory once per comparison. The workers write their results straight
+    into a shared (methods, points) array. The pool is started on first use and
+    kept for later comparisons.
+    """
+
+    def __init__(self, methods=None, max_workers=None, buffers=None):
+        """
+        Args:
+            methods (list): Reconstruction methods, defaults to every registered one
+            max_workers (int): Number of worker processes, defaults to one per method
+            buffers (SharedBufferStore): Store whose arrays are passed without copying
+        """
+        self.methods = list(methods) if methods is not None else reconstruction.available_methods()
+        self.max_workers = max_workers or min(len(self.methods), os.cpu_count() or 1)
+        self.buffers = buffers
+        self.executor = None
+
+    def share(self, values):
+        """Return a shared block holding values, and whether it was borrowed from the store."""
+        block = self.buffers.acquire(values) if self.buffers is not None else None
+        if block is not None:
+            return block, True
+        return SharedArray.from_array(np.asarray(values, dtype=float)), False
+
+    def compare(self, samples_t, samples_y, out_t, reference=None):
+        """
+        Reconstruct the samples with every method
+
+        Only the part of out_t up to the last sample is reconstructed, so every
+        method is scored on the same interval without extrapolation.
+
+        Args:
+            samples_t (array-like): Sample instants
+            samples_y (array-like): Sample amplitudes
+            out_t (UniformTimeBase or array-like): Instants to evaluate the
+                reconstructions at
+            reference (array-like): Signal on out_t the reconstructions are scored
+                against, or None to skip the error metrics
+
+        Returns:
+            dict: out_t, reconstructions ({method: amplitude}), differences
+                ({method: reference - amplitude}, empty without a reference), metrics
+                ({method: (rmse, max error)}) and errors ({method: message} for the
+                methods that could not run)
+        """
+        if self.executor is None:
+            # spawn keeps the workers free of the GUI's threads and Qt state
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                mp_context=multiprocessing.get_context("spawn"))
+
+        uniform = isinstance(out_t, UniformTimeBase)
+        count = int(np.searchsorted(out_t, samples_t[-1], side='right'))
+        shared = (samples_t, samples_y) if uniform else (samples_t, samples_y, out_t)
+        inputs = [self.share(values) for values in shared]
+        output = SharedArray((len(self.methods), count))
+        try:
+            specs = [block.spec for block, _ in inputs]
+            out_t_arg = out_t if uniform else specs[2]
+            futures = [self.executor.submit(reconstruct_into, method, row, count, specs[0], specs[1], out_t_arg,
+                                            output.spec)
+                       for row, method in enumerate(self.methods)]
+            wait(futures)
+            messages = [future.result() for future in futures]
+            results = output.array.copy()
+        finally:
+            output.close()
+            for block, borrowed in inputs:
+                if borrowed:
+                    self.buffers.release(block)
+                else:
+                    block.close()
+        out_t = out_t[:count] if uniform else np.array(out_t[:count], dtype=float)
+
+        reconstructions = {method: results[row] for row, method in enumerate(self.methods)
+                           if messages[row] is None}
+        differences = {}
+        metrics = {}
+        if reference is not None:
+            reference = np.asarray(reference[:count], dtype=float)
+            for method, amplitude in reconstructions.items():
+                difference = reference - amplitude
+                differences[method] = difference
+                metrics[method] = (float(np.sqrt(np.mean(difference ** 2))), float(np.max(np.abs(difference))))
+
+        return {
+            "out_t": out_t,
+            "reconstructions": reconstructions,
+            "differences": differences,
+            "metrics": metrics,
+            "errors": {method: message for method, message in zip(self.methods, messages) if message is not None},
+        }
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,141 @@
+import contextlib
+import cProfile
+import io
+import logging
+import os
+import pstats
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+
+logger = logging.getLogger("signal_studio")
+
+# Shared do-nothing context returned by disabled timers
+_NO_TIMING = contextlib.nullcontext()
+
+
+def configure_logging():
+    """
+    Set up logging from the SIGNAL_STUDIO_LOG_LEVEL environment variable (default WARNING)
+
+    Messages are formatted lazily, so arrays passed as logging arguments are only
+    turned into text when their level is enabled.
+    """
+    level = os.environ.get("SIGNAL_STUDIO_LOG_LEVEL", "WARNING").upper()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logger.setLevel(getattr(logging, level, logging.WARNING))
+
+
+class StageTimer:
+    """
+    Wall-clock timings of named stages
+
+    measure() returns a shared no-op context while the timer is disabled, so timed
+    code costs one attribute check when instrumentation is off. The last `history`
+    durations of every stage are kept.
+    """
+
+    def __init__(self, enabled=False, history=60):
+        """
+        Args:
+            enabled (bool): Record timings from the start
+            history (int): Number of durations kept per stage
+        """
+        self.enabled = enabled
+        self.timings = defaultdict(lambda: deque(maxlen=history))
+
+    def measure(self, stage):
+        """Context manager timing the enclosed block as `stage`."""
+        if not self.enabled:
+            return _NO_TIMING
+        return self._measure(stage)
+
+    @contextlib.contextmanager
+    def _measure(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, seconds):
+        """Add a duration measured elsewhere."""
+        if self.enabled:
+            self.timings[stage].append(seconds)
+
+    def last(self, stage):
+        """Most recent duration of a stage in seconds, or None."""
+        durations = self.timings.get(stage)
+        return durations[-1] if durations else None
+
+    def summary(self):
+        """Return {stage: (last, mean, count)} in seconds."""
+        return {stage: (durations[-1], sum(durations) / len(durations), len(durations))
+                for stage, durations in list(self.timings.items()) if durations}
+
+
+class ProfileCapture:
+    """
+    Optional cProfile and tracemalloc capture of the recompute jobs
+
+    While active, call() runs functions under one accumulating cProfile profile and
+    tracemalloc traces allocations. stop() writes the profile to disk and logs the
+    hottest functions and the largest allocation sites. When inactive, call() is a
+    plain function call.
+    """
+
+    def __init__(self):
+        self.profile = None
+
+    @property
+    def active(self):
+        return self.profile is not None
+
+    def start(self):
+        """Begin a capture."""
+        if self.active:
+            return
+        self.profile = cProfile.Profile()
+        tracemalloc.start()
+
+    def call(self, func, *args, **kwargs):
+        """Run func, under the profiler while a capture is active."""
+        profile = self.profile
+        if profile is None:
+            return func(*args, **kwargs)
+        return profile.runcall(func, *args, **kwargs)
+
+    def stop(self, path=None, top=20):
+        """
+        End the capture and report it
+
+        Args:
+            path (str): Where to write the cProfile stats, defaults to a file in the
+                temporary directory
+            top (int): Number of functions and allocation sites logged
+
+        Returns:
+            str: Path of the written stats file, or None if no capture was active
+        """
+        if not self.active:
+            return None
+        profile, self.profile = self.profile, None
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        if path is None:
+            path = os.path.join(tempfile.gettempdir(), f"signal_studio_{int(time.time())}.prof")
+        profile.dump_stats(path)
+
+        if profile.getstats():
+            report = io.StringIO()
+            pstats.Stats(profile, stream=report).sort_stats("cumulative").print_stats(top)
+            logger.info("Profile written to %s\n%s", path, report.getvalue())
+        else:
+            # pstats refuses an empty profile, e.g. when no job finished during the capture
+            logger.info("Profile written to %s, no calls were captured", path)
+        for stat in snapshot.statistics("lineno")[:top]:
+            logger.info("Allocation: %s", stat)
+        return path
@@ -0,0 +1,104 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+def hash_samples(*arrays):
+    """Return a short digest identifying the contents of the given arrays."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str(array.dtype).encode())
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def interpolant_nbytes(obj, depth=2):
+    """
+    Estimate the memory held by a fitted interpolant
+
+    Sums the NumPy arrays reachable through the object's attributes, following
+    nested objects (e.g. the BSpline inside interp1d) up to the given depth.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if depth == 0 or not hasattr(obj, "__dict__"):
+        return 0
+    return sum(interpolant_nbytes(value, depth - 1) for value in vars(obj).values())
+
+
+class InterpolantCache:
+    """
+    LRU cache of fitted interpolant objects
+
+    Entries are keyed by (method, sampling frequency, sample hash, SNR seed, params)
+    so switching reconstruction methods back and forth reuses spline systems that
+    were already solved. The least recently used entries are evicted once the
+    estimated memory of the cached interpolants exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=32):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(method, samples_t, samples_y, sampling_frequency=None, seed=None, params=None):
+        """Build the cache key for a sample set."""
+        return (method, sampling_frequency, hash_samples(samples_t, samples_y), seed,
+                tuple(sorted((params or {}).items())))
+
+    def get_or_fit(self, key, fit):
+        """
+        Return the cached interpolant for key, fitting and storing it on a miss
+
+        Args:
+            key (tuple): Key built with make_key
+            fit (callable): Function returning a new interpolant
+
+        Returns:
+            callable: The fitted interpolant
+        """
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+        self.misses += 1
+        interpolant = fit()
+        size = interpolant_nbytes(interpolant)
+        if size <= self.max_bytes:
+            self.entries[key] = (interpolant, size)
+            self.total_bytes += size
+            self.evict()
+        return interpolant
+
+    def evict(self):
+        """Drop least recently used entries until the cache is within its limits."""
+        while self.entries and (self.total_bytes > self.max_bytes or len(self.entries) > self.max_entries):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every cached interpolant (the counters are kept)."""
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Return the hit/miss counters and current memory use."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+        }
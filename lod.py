@@ -0,0 +1,72 @@
+import numpy as np
+
+from timebase import UniformTimeBase
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max summary of a curve for level-of-detail rendering
+
+    Level k stores the minimum and maximum of consecutive blocks of factor**k
+    points. query() picks the coarsest level that still gives about one block per
+    pixel of the visible range, so the number of points handed to the plot depends
+    on the screen width rather than on the signal length, while peaks stay visible.
+    """
+
+    def __init__(self, x, y, factor=4, min_blocks=256):
+        """
+        Args:
+            x (UniformTimeBase or array-like): Sorted x values (e.g. time). The
+                instants of a UniformTimeBase are only computed for the points returned
+            y (array-like): y values
+            factor (int): Number of blocks merged from one level to the next
+            min_blocks (int): Stop building levels once a level has fewer blocks
+        """
+        self.x = x if isinstance(x, UniformTimeBase) else np.asarray(x)
+        self.y = np.asarray(y)
+        self.factor = factor
+        self.levels = []
+
+        mins = maxs = self.y
+        while len(mins) > min_blocks * factor:
+            mins = self.reduce(mins, np.minimum)
+            maxs = self.reduce(maxs, np.maximum)
+            self.levels.append((mins, maxs))
+
+    def reduce(self, values, ufunc):
+        """Combine consecutive blocks of `factor` values, padding the tail with its last value."""
+        padding = -len(values) % self.factor
+        if padding:
+            values = np.concatenate([values, np.repeat(values[-1:], padding)])
+        return ufunc.reduce(values.reshape(-1, self.factor), axis=1)
+
+    def query(self, x_min=None, x_max=None, pixels=1000):
+        """
+        Return the points needed to draw the curve between x_min and x_max
+
+        Args:
+            x_min (float): Left edge of the view, defaults to the first point
+            x_max (float): Right edge of the view, defaults to the last point
+            pixels (int): Width of the view in pixels
+
+        Returns:
+            tuple: x and y arrays. Decimated levels yield a (min, max) pair per block
+        """
+        n = len(self.x)
+        start = 0 if x_min is None else max(int(self.x.searchsorted(x_min, side='left')) - 1, 0)
+        stop = n if x_max is None else min(int(self.x.searchsorted(x_max, side='right')) + 1, n)
+        count = stop - start
+
+        level = 0
+        while level < len(self.levels) and count > 2 * pixels * self.factor ** level:
+            level += 1
+        if level == 0:
+            return np.asarray(self.x[start:stop]), self.y[start:stop]
+
+        block = self.factor ** level
+        first = start // block
+        last = -(-stop // block)
+        mins, maxs = self.levels[level - 1]
+        x = np.repeat(self.x[::block][first:last], 2)
+        y = np.column_stack([mins[first:last], maxs[first:last]]).ravel()
+        return x, y
@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class NoiseGenerator:
+    """
+    Seeded, cached white Gaussian noise
+
+    One unit-variance noise vector is drawn per signal length and realization and
+    then only rescaled, so changing the SNR is a single multiply-add and the same
+    inputs always produce the same noisy signal. regenerate() switches to a new
+    realization; the session seed makes every realization reproducible. The cache
+    is shared by the UI thread and the recompute worker, so it is guarded by a lock.
+    """
+
+    def __init__(self, seed=None, max_vectors=4):
+        """
+        Args:
+            seed (int): Session seed. A random one is drawn when None
+            max_vectors (int): Number of unit noise vectors kept in memory
+        """
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        self.seed = int(seed)
+        self.realization = 0
+        self.max_vectors = max_vectors
+        self.vectors = OrderedDict()
+        self.lock = threading.Lock()
+
+    @property
+    def key(self):
+        """Identifier of the current noise realization."""
+        return self.seed, self.realization
+
+    def regenerate(self):
+        """Switch to a fresh noise realization."""
+        self.realization += 1
+        return self.key
+
+    def unit_noise(self, length, key=None):
+        """
+        Return the unit-variance noise vector for a signal length
+
+        Args:
+            length (int): Number of samples
+            key (tuple): Realization to use, defaults to the current one
+
+        Returns:
+            ndarray: Read-only noise vector
+        """
+        key = self.key if key is None else key
+        cache_key = (key, length)
+        with self.lock:
+            if cache_key in self.vectors:
+                self.vectors.move_to_end(cache_key)
+                return self.vectors[cache_key]
+
+        # Drawn outside the lock; a vector drawn concurrently for the same key is identical
+        vector = np.random.default_rng(list(key)).standard_normal(length)
+        vector.setflags(write=False)
+        with self.lock:
+            vector = self.vectors.setdefault(cache_key, vector)
+            self.vectors.move_to_end(cache_key)
+            while len(self.vectors) > self.max_vectors:
+                self.vectors.popitem(last=False)
+        return vector
+
+    def add_noise(self, combined_amplitude, snr, signal_power=None, key=None):
+        """
+        Add noise to a signal at the given SNR (in dB)
+
+        Args:
+            combined_amplitude (ndarray): Clean signal
+            snr (float): Signal-to-noise ratio in dB
+            signal_power (float): Mean power of the clean signal, computed when None
+            key (tuple): Noise realization to use, defaults to the current one
+
+        Returns:
+            ndarray: Noisy signal
+        """
+        if signal_power is None:
+            signal_power = np.mean(combined_amplitude ** 2)
+
+        # Noise power calculation with SNR in decibels (dB)
+        gain = np.sqrt(signal_power / (10 ** (snr / 10)))
+        noisy_signal = self.unit_noise(len(combined_amplitude), key) * gain
+        noisy_signal += combined_amplitude
+        return noisy_signal
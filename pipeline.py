@@ -0,0 +1,443 @@
+import functools
+from collections import Counter
+
+import numpy as np
+
+import reconstruction
+from instrumentation import StageTimer, logger
+from spectrum import compute_spectrum, two_sided
+from timebase import UniformTimeBase, time_step
+
+
+# Number of cached fractional-index tables, one per (time base, sampling frequency)
+SAMPLE_TABLE_CACHE_SIZE = 16
+
+
+def sample_count(start, end, sampling_frequency):
+    """Number of instants start + k / fs that fall before end."""
+    # Rounding first keeps spans that are whole periods from picking up an extra sample
+    return max(int(np.ceil(round((end - start) * sampling_frequency, 9))), 0)
+
+
+@functools.lru_cache(maxsize=SAMPLE_TABLE_CACHE_SIZE)
+def fractional_index_table(length, ratio, count):
+    """
+    Positions of the sample instants on a uniform time base
+
+    Args:
+        length (int): Number of points of the time base
+        ratio (float): Time base points per sampling period
+        count (int): Number of samples
+
+    Returns:
+        tuple: Read-only arrays of the left neighbour index of every sample and its
+            fractional offset towards the right neighbour
+    """
+    positions = np.arange(count) * ratio
+    index = np.minimum(positions.astype(np.intp), max(length - 2, 0))
+    fraction = positions - index
+    index.flags.writeable = False
+    fraction.flags.writeable = False
+    return index, fraction
+
+
+def read_only(values):
+    """Return a view of an array that cannot be written through."""
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+def take_samples(time, amplitude, sampling_frequency):
+    """
+    Sample a signal at the given frequency
+
+    The sample instants are start + k / fs, computed from the integer k so they do
+    not drift. On a uniform time base whose spacing divides the sampling period,
+    the samples are strided read-only views of the time base and the signal
+    (no copy, no interpolation). Other ratios interpolate between the neighbouring
+    points with a cached index table; anything else falls back to np.interp.
+    A UniformTimeBase is known to be uniform; an array is checked on the points
+    that are read.
+
+    Args:
+        time (UniformTimeBase or array-like): Time base of the signal
+        amplitude (array-like): Signal values
+        sampling_frequency (float): Sampling frequency in Hz
+
+    Returns:
+        tuple: Sample instants and sampled amplitudes
+    """
+    uniform = isinstance(time, UniformTimeBase)
+    if not uniform:
+        time = np.asarray(time)
+    amplitude = np.asarray(amplitude)
+    length = len(time)
+    count = sample_count(time[0], time[length - 1], sampling_frequency)
+    samples = time[0] + np.arange(count) / sampling_frequency
+    if count == 0 or length < 2:
+        return samples, np.interp(samples, time, amplitude)
+
+    spacing = time.step if uniform else (time[length - 1] - time[0]) / (length - 1)
+    ratio = 1 / (sampling_frequency * spacing)
+    # The checks below only look at the points that are read, so a time base that
+    # is not uniform is detected without scanning all of it
+    tolerance = 1e-6 * spacing
+    step = int(round(ratio))
+    if step >= 1 and abs(ratio - step) <= 1e-9 * ratio:
+        strided = slice(0, (count - 1) * step + 1, step)
+        if uniform:
+            return samples, read_only(amplitude[strided])
+        if np.all(np.abs(time[strided] - samples) <= tolerance):
+            return read_only(time[strided]), read_only(amplitude[strided])
+
+    index, fraction = fractional_index_table(length, ratio, count)
+    if uniform or np.all(np.abs(time[index] + fraction * spacing - samples) <= tolerance) and \
+            np.all(np.abs(time[index + 1] - time[index] - spacing) <= tolerance):
+        left = amplitude[index]
+        return samples, left + fraction * (amplitude[index + 1] - left)
+    return samples, np.interp(samples, time, amplitude)
+
+
+def output_grid(time, samples, window=None):
+    """
+    Part of the time base a reconstruction is evaluated on
+
+    The reconstruction is evaluated on the signal's own time instants, so it can be
+    compared with the original point for point. Only instants inside the span of
+    the samples are used (nothing is extrapolated), optionally narrowed to a window
+    such as the visible range of a viewer.
+
+    Args:
+        time (UniformTimeBase or ndarray): Sorted time base of the signal
+        samples (ndarray): Sample instants
+        window (tuple): Optional (start, end) time range
+
+    Returns:
+        slice: Indices of the time base to evaluate the reconstruction at
+    """
+    if len(samples) == 0:
+        return slice(0, 0)
+    start, end = samples[0], samples[-1]
+    if window is not None:
+        start, end = max(start, window[0]), min(end, window[1])
+    first = int(time.searchsorted(start, side='left'))
+    last = int(time.searchsorted(end, side='right'))
+    return slice(first, max(first, last))
+
+
+def check_data_validity(samples, sampled_amplitude):
+    """Check that the samples can be used for reconstruction."""
+    try:
+        samples = np.array(samples)
+        sampled_amplitude = np.array(sampled_amplitude)
+        # The arrays are only formatted when debug logging is enabled
+        logger.debug("Checking data - samples: %s, sampled amplitude: %s", samples, sampled_amplitude)
+
+        if len(samples) < 2 or len(sampled_amplitude) < 2:
+            logger.warning("Not enough data points for interpolation.")
+            return False
+
+        if np.any(np.isnan(samples)) or np.any(np.isnan(sampled_amplitude)):
+            logger.warning("Data contains NaN values.")
+            return False
+
+        return True
+    except Exception as e:
+        logger.error("Error during data validity check: %s", e)
+        return False
+
+
+def signal_bandwidth(original_amplitude, original_time, threshold=0.1):
+    """
+    Find the highest significant frequency component of a signal
+
+    Args:
+        original_amplitude (array-like): Signal values
+        original_time (UniformTimeBase or array-like): Uniform time base of the signal
+        threshold (float): Fraction of the peak magnitude a component must exceed
+
+    Returns:
+        tuple: Highest significant frequency and its normalized magnitude,
+            or None if no component exceeds the threshold
+    """
+    # The signal is real, so the one-sided transform holds every magnitude needed
+    N = len(original_amplitude)
+    fourier_transform = np.fft.rfft(original_amplitude, n=N)
+    freq = np.fft.rfftfreq(N, d=time_step(original_time))
+    fourier_transform_magnitude = np.abs(fourier_transform)
+
+    # Normalize the magnitude
+    fourier_transform_magnitude /= np.max(fourier_transform_magnitude)
+
+    # Apply a threshold to filter out insignificant magnitudes
+    significant_indices = np.where(fourier_transform_magnitude[:N // 2] > threshold)[0]
+    if significant_indices.size == 0:
+        return None
+
+    # Find the highest frequency among significant components
+    max_index = significant_indices[-1]
+    return freq[max_index], fourier_transform_magnitude[max_index]
+
+
+def same_value(old, new):
+    """Check whether an input value is unchanged (arrays are compared by identity)."""
+    if old is new:
+        return True
+    if isinstance(old, tuple) and isinstance(new, tuple):
+        return len(old) == len(new) and all(same_value(a, b) for a, b in zip(old, new))
+    if isinstance(old, np.ndarray) or isinstance(new, np.ndarray):
+        return False
+    try:
+        return bool(old == new)
+    except Exception:
+        return False
+
+
+class DataflowGraph:
+    """
+    Minimal memoizing dataflow graph
+
+    Inputs are plain values with a version number that only changes when the value
+    does. Stages are functions of other inputs or stages; a stage is recomputed when
+    it is requested and the version of at least one of its inputs changed since its
+    last run. run_counts records how often each stage has run, and the optional
+    timer how long each run took.
+    """
+
+    def __init__(self, timer=None):
+        """
+        Args:
+            timer (StageTimer): Records the duration of every stage run; a disabled
+                timer is used when None
+        """
+        self.inputs = {}
+        self.stages = {}
+        self.values = {}
+        self.versions = {}
+        self.input_versions = {}
+        self.run_counts = Counter()
+        self.timer = StageTimer() if timer is None else timer
+
+    def add_stage(self, name, compute, inputs):
+        """
+        Register a derived product
+
+        Args:
+            name (str): Name of the stage
+            compute (callable): Function called with the values of the inputs, in order
+            inputs (tuple): Names of the inputs or stages the product depends on
+        """
+        self.stages[name] = (compute, tuple(inputs))
+
+    def set_input(self, name, value):
+        """Set an input value, invalidating dependent stages only if it changed."""
+        if name in self.inputs and same_value(self.inputs[name], value):
+            return False
+        self.inputs[name] = value
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return True
+
+    def get(self, name):
+        """Return the value of an input or stage, recomputing stale stages."""
+        if name in self.inputs:
+            return self.inputs[name]
+
+        compute, inputs = self.stages[name]
+        arguments = [self.get(input_name) for input_name in inputs]
+        current_versions = tuple(self.versions[input_name] for input_name in inputs)
+        if self.input_versions.get(name) != current_versions:
+            with self.timer.measure(name):
+                self.values[name] = compute(*arguments)
+            self.versions[name] = self.versions.get(name, 0) + 1
+            self.input_versions[name] = current_versions
+            self.run_counts[name] += 1
+        return self.values[name]
+
+    def invalidate(self):
+        """Forget every computed product so the next request recomputes all stages."""
+        self.values.clear()
+        self.input_versions.clear()
+
+
+class SignalPipeline(DataflowGraph):
+    """
+    Update graph behind the four viewers
+
+    components, the combined signal, snr, sampling_frequency, method and the output
+    window are inputs;
+    the noisy signal, samples, reconstruction, difference, bandwidth and spectrum are each
+    computed once per change of their inputs. evaluate() reports which stages ran, so the GUI
+    only redraws what changed and debug builds can check that no stage ran twice.
+    """
+
+    def __init__(self, add_noise, evaluate=None, cache=None, buffers=None, timer=None):
+        """
+        Args:
+            add_noise (callable): add_noise(combined amplitude, snr, signal power, noise key)
+                -> noisy amplitude
+            evaluate (callable): Optional evaluate(components, t) -> clean amplitude at t.
+                When given, samples are evaluated exactly at the sample instants and
+                only the noise is interpolated from the time grid
+            cache (InterpolantCache): Optional cache of fitted interpolants
+            buffers (SharedBufferStore): Optional store the samples are placed in, so
+                worker processes can attach to them by name
+            timer (StageTimer): Optional timer of the stage runs
+        """
+        super().__init__(timer)
+        self.evaluate_components = evaluate
+        self.cache = cache
+        self.buffers = buffers
+        self.add_stage("noisy", lambda combined, snr, key: add_noise(combined[1], snr, combined[2], key),
+                       ("combined", "snr", "noise_key"))
+        self.add_stage("samples", self.sample, ("components", "combined", "noisy", "sampling_frequency"))
+        self.add_stage("grid", lambda combined, samples, window: output_grid(combined[0], samples[0], window),
+                       ("combined", "samples", "output_window"))
+        self.add_stage("reconstruction", self.reconstruct,
+                       ("samples", "method", "sampling_frequency", "noise_key", "combined", "grid"))
+        self.add_stage("difference", self.difference, ("combined", "grid", "reconstruction"))
+        self.add_stage("bandwidth", self.bandwidth, ("combined", "spectrum_settings"))
+        self.add_stage("spectrum", self.spectrum, ("combined", "spectrum_settings"))
+
+    def share(self, key, values):
+        """Move a product into the shared buffer store, when there is one."""
+        if self.buffers is None:
+            return values
+        return self.buffers.put(key, values)
+
+    def release_buffers(self):
+        """
+        Free the shared samples and the signal snapshot once no signal is left
+
+        Must not run concurrently with evaluate(). The next evaluate() recomputes
+        every stage.
+        """
+        if self.buffers is not None:
+            self.buffers.discard("samples")
+            self.buffers.discard("sampled_amplitude")
+        # The inputs would otherwise keep the mappings of the discarded signal open
+        self.inputs.pop("components", None)
+        self.inputs.pop("combined", None)
+        self.invalidate()
+
+    def sample(self, components, combined, noisy, sampling_frequency):
+        time, original_signal = combined[:2]
+        if self.evaluate_components is None:
+            samples, sampled_amplitude = take_samples(time, noisy, sampling_frequency)
+        else:
+            # Sampling is linear, so the noise at the sample instants is the difference of
+            # the sampled signals; no full-length noise-only temporary is built
+            samples, sampled_noisy = take_samples(time, noisy, sampling_frequency)
+            sampled_noise = sampled_noisy - take_samples(time, original_signal, sampling_frequency)[1]
+            sampled_amplitude = sampled_noise + self.evaluate_components(components, samples)
+        return self.share("samples", samples), self.share("sampled_amplitude", sampled_amplitude)
+
+    def reconstruct(self, samples, method, sampling_frequency, noise_key, combined, grid):
+        """
+        Reconstruction on the output grid as (time, amplitude, error)
+
+        A method that cannot run on these samples (e.g. too few of them) gives
+        (None, None, message) instead of failing the whole update, so the stages
+        that already ran are still delivered.
+        """
+        if not check_data_validity(*samples):
+            return None, None, "Not enough valid samples to reconstruct."
+        out_t = combined[0][grid]
+        if len(out_t) == 0:
+            return out_t, np.empty(0), None
+        try:
+            out_t, out_y = reconstruction.reconstruct(samples[0], samples[1], out_t=out_t, method=method,
+                                                      cache=self.cache, sampling_frequency=sampling_frequency,
+                                                      seed=noise_key)
+        except ValueError as e:
+            logger.warning("Reconstruction failed: %s", e)
+            return None, None, str(e)
+        return out_t, out_y, None
+
+    @staticmethod
+    def difference(combined, grid, reconstructed):
+        reconstructed_amplitude = reconstructed[1]
+        if reconstructed_amplitude is None:
+            return None
+        # Same instants as the reconstruction, so the subtraction is point for point
+        return np.asarray(combined[1][grid], dtype=float) - reconstructed_amplitude
+
+    @staticmethod
+    def bandwidth(combined, spectrum_settings):
+        """Bandwidth markers, only computed while the bandwidth view is shown."""
+        if spectrum_settings is not None:
+            return None
+        return signal_bandwidth(combined[1], combined[0])
+
+    @staticmethod
+    def spectrum(combined, spectrum_settings):
+        """Two-sided magnitude spectrum of the clean signal, or None when it is not displayed."""
+        if spectrum_settings is None:
+            return None
+        time, original_signal = combined[:2]
+        window, welch_segment = spectrum_settings
+        freqs, magnitude = compute_spectrum(original_signal, time_step(time), window=window,
+                                            welch_segment=welch_segment)
+        return two_sided(freqs, magnitude)
+
+    def evaluate(self, components, combined, snr, sampling_frequency, method, noise_key=None,
+                 spectrum_settings=None, output_window=None):
+        """
+        Update the inputs and bring every product up to date
+
+        Args:
+            components (tuple): Signal components
+            combined (tuple): (time, combined amplitude, signal power) snapshot; a new
+                tuple must be passed whenever the components change
+            snr (float): Signal-to-noise ratio in dB
+            sampling_frequency (float): Sampling frequency in Hz
+            method (str): Name of a registered reconstruction method
+            noise_key (tuple): Noise realization passed on to add_noise
+            spectrum_settings (tuple): (window, Welch segment length) of the magnitude
+                spectrum, or None when only the bandwidth is displayed
+            output_window (tuple): (start, end) time range the reconstruction and
+                difference are evaluated on, or None for the whole signal
+
+        Returns:
+            dict: time, original_signal, noisy_signal, samples, sampled_amplitude,
+                sampling_frequency, reconstructed_time, reconstructed_amplitude,
+                reconstruction_error (None, or why the method could not run),
+                difference (on reconstructed_time), bandwidth (None while the spectrum
+                is displayed), spectrum, plus changed (the set of stages that ran) and
+                stage_runs (how often each of them ran during this call)
+        """
+        before = Counter(self.run_counts)
+        self.set_input("components", tuple(components))
+        self.set_input("combined", combined)
+        self.set_input("snr", snr)
+        self.set_input("sampling_frequency", sampling_frequency)
+        self.set_input("method", method)
+        self.set_input("noise_key", noise_key)
+        self.set_input("spectrum_settings", spectrum_settings)
+        self.set_input("output_window", output_window)
+
+        time, original_signal = combined[:2]
+        noisy_signal = self.get("noisy")
+        samples, sampled_amplitude = self.get("samples")
+        reconstructed_time, reconstructed_amplitude, reconstruction_error = self.get("reconstruction")
+        difference = self.get("difference")
+        bandwidth = self.get("bandwidth")
+        spectrum = self.get("spectrum")
+
+        stage_runs = self.run_counts - before
+        return {
+            "time": time,
+            "original_signal": original_signal,
+            "noisy_signal": noisy_signal,
+            "samples": samples,
+            "sampled_amplitude": sampled_amplitude,
+            "sampling_frequency": sampling_frequency,
+            "reconstructed_time": reconstructed_time,
+            "reconstructed_amplitude": reconstructed_amplitude,
+            "reconstruction_error": reconstruction_error,
+            "difference": difference,
+            "bandwidth": bandwidth,
+            "spectrum": spectrum,
+            "changed": set(stage_runs),
+            "stage_runs": dict(stage_runs),
+        }
@@ -0,0 +1,527 @@
+import functools
+
+import numpy as np
+
+from timebase import UniformTimeBase
+
+# scipy.interpolate is imported inside the fitters that use it, so it is only
+# loaded once one of those methods runs rather than when the GUI starts
+
+# Registry of reconstruction methods, keyed by the names shown in the GUI combobox.
+# Every entry has the signature f(x_known, y_known, x_interp, **params) -> y_interp
+RECONSTRUCTION_METHODS = {}
+
+# Minimum number of samples each method needs to produce a result
+MIN_SAMPLES = {}
+
+# Methods backed by a fitted interpolant object that can be reused across output grids.
+# Every entry has the signature fit(x_known, y_known) -> callable(x_interp)
+INTERPOLANT_FITTERS = {}
+
+
+def register_method(name, min_samples=2):
+    """
+    Register a reconstruction method under the given name
+
+    Args:
+        name (str): Name used to select the method (as shown in the GUI)
+        min_samples (int): Minimum number of samples the method needs
+
+    Returns:
+        function: Decorator that adds the function to the registry
+    """
+    def decorator(func):
+        RECONSTRUCTION_METHODS[name] = func
+        MIN_SAMPLES[name] = min_samples
+        return func
+    return decorator
+
+
+def register_fitter(name):
+    """
+    Register the interpolant fitting function behind a reconstruction method
+
+    Args:
+        name (str): Name of the reconstruction method the fitter belongs to
+
+    Returns:
+        function: Decorator that adds the function to the fitter registry
+    """
+    def decorator(fit):
+        INTERPOLANT_FITTERS[name] = fit
+        return fit
+    return decorator
+
+
+def available_methods():
+    """Return the names of all registered reconstruction methods."""
+    return list(RECONSTRUCTION_METHODS)
+
+
+def reconstruct(samples_t, samples_y, out_t=None, method="Linear", num_points=1500, cache=None,
+                sampling_frequency=None, seed=None, **params):
+    """
+    Reconstruct a signal from its samples without touching any widget
+
+    Args:
+        samples_t (array-like): Sample instants
+        samples_y (array-like): Sample amplitudes
+        out_t (UniformTimeBase or array-like): Instants to evaluate the reconstruction
+            at. When None, num_points evenly spaced instants spanning the samples are used
+        method (str): Name of a registered reconstruction method
+        num_points (int): Size of the default output grid
+        cache (InterpolantCache): Optional cache of fitted interpolants. Only used by
+            methods that have a registered fitter
+        sampling_frequency (float): Sampling frequency, part of the cache key
+        seed (int): Seed of the noise realization, part of the cache key
+        **params: Extra keyword arguments forwarded to the method
+
+    Returns:
+        tuple: Output time (out_t as given, a UniformTimeBase for the default grid)
+            and reconstructed amplitude. The instants of a UniformTimeBase are only
+            materialized while the method runs
+    """
+    if method not in RECONSTRUCTION_METHODS:
+        raise ValueError(f"Unknown reconstruction method '{method}'. "
+                         f"Available methods: {', '.join(available_methods())}")
+
+    samples_t = np.asarray(samples_t, dtype=float)
+    samples_y = np.asarray(samples_y, dtype=float)
+
+    if len(samples_t) != len(samples_y):
+        raise ValueError("Sample instants and amplitudes must have the same length.")
+    if len(samples_t) < MIN_SAMPLES[method]:
+        raise ValueError(f"{method} reconstruction requires at least {MIN_SAMPLES[method]} samples.")
+
+    if out_t is None:
+        out_t = UniformTimeBase.linspace(samples_t.min(), samples_t.max(), num_points)
+    elif not isinstance(out_t, UniformTimeBase):
+        out_t = np.asarray(out_t, dtype=float)
+    instants = np.asarray(out_t, dtype=float)
+
+    if cache is not None and method in INTERPOLANT_FITTERS:
+        key = cache.make_key(method, samples_t, samples_y, sampling_frequency, seed, params)
+        interpolant = cache.get_or_fit(key, lambda: INTERPOLANT_FITTERS[method](samples_t, samples_y, **params))
+        out_y = interpolant(instants)
+    else:
+        out_y = RECONSTRUCTION_METHODS[method](samples_t, samples_y, instants, **params)
+    return out_t, np.asarray(out_y)
+
+
+@register_method("Linear")
+def linear_interpolation(x_known, y_known, x_interp):
+    """
+    Perform linear interpolation
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to interpolate at
+
+    Returns:
+        ndarray: Interpolated y values
+    """
+    return fit_linear(x_known, y_known)(x_interp)
+
+
+@register_fitter("Linear")
+def fit_linear(x_known, y_known):
+    """Fit a linear interpolant that extrapolates past the samples."""
+    from scipy.interpolate import interp1d
+    return interp1d(x_known, y_known, kind='linear', fill_value='extrapolate')
+
+
+@register_method("Quadratic", min_samples=3)
+def quadratic_interpolation(x_known, y_known, x_interp):
+    """
+    Perform quadratic interpolation
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to interpolate at
+
+    Returns:
+        ndarray: Interpolated y values
+    """
+    return fit_quadratic(x_known, y_known)(x_interp)
+
+
+@register_fitter("Quadratic")
+def fit_quadratic(x_known, y_known):
+    """Fit a quadratic spline interpolant that extrapolates past the samples."""
+    from scipy.interpolate import interp1d
+    return interp1d(x_known, y_known, kind='quadratic', fill_value='extrapolate')
+
+
+# Window functions for the truncated sinc kernel, evaluated on x / half_width in [-1, 1]
+SINC_WINDOWS = {
+    "rect": lambda x: np.ones_like(x),
+    "hann": lambda x: 0.5 * (1 + np.cos(np.pi * x)),
+    "lanczos": np.sinc,
+}
+
+# Upper bound on the number of kernel weights held in memory at once
+KERNEL_CHUNK_ELEMENTS = 1 << 20
+
+# The FFT sinc engine reads the interpolant off a grid SINC_UPSAMPLING times finer
+# than the sample period. The automatic engine choice falls back to the kernel when
+# that grid would exceed SINC_DENSE_MAX_POINTS.
+SINC_UPSAMPLING = 64
+SINC_DENSE_MAX_POINTS = 1 << 24
+
+
+def sampling_period(x_known):
+    """Return the average spacing between the sample instants."""
+    return (x_known[-1] - x_known[0]) / (len(x_known) - 1)
+
+
+def is_uniform(x_known, rtol=1e-6):
+    """Check whether the sample instants are evenly spaced."""
+    period = sampling_period(x_known)
+    return bool(np.all(np.abs(np.diff(x_known) - period) <= rtol * abs(period)))
+
+
+@register_method("Sinc")
+def sinc_interpolation(x_known, y_known, x_interp, engine="auto", half_width=32, window="hann"):
+    """
+    Whittaker-Shannon (sinc) reconstruction
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to interpolate at
+        engine (str): "fft" for the band-limited trigonometric interpolant (uniform
+            samples only, periodic at the edges, see sinc_fft), "kernel" for the
+            truncated windowed-sinc kernel, or "auto" to pick fft whenever the
+            samples are uniform and its work stays bounded
+        half_width (int): Number of samples used on each side by the kernel engine
+        window (str): Taper applied to the kernel engine ("hann", "lanczos" or "rect")
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    if engine == "auto":
+        bounded = len(x_known) * SINC_UPSAMPLING <= SINC_DENSE_MAX_POINTS
+        engine = "fft" if bounded and is_uniform(x_known) else "kernel"
+
+    if engine == "fft":
+        if not is_uniform(x_known):
+            raise ValueError("The FFT sinc engine requires uniformly spaced samples.")
+        return sinc_fft(x_known, y_known, x_interp)
+    if engine == "kernel":
+        return sinc_kernel(x_known, y_known, x_interp, half_width=half_width, window=window)
+    raise ValueError(f"Unknown sinc engine '{engine}'.")
+
+
+def sinc_fft(x_known, y_known, x_interp, upsampling=SINC_UPSAMPLING):
+    """
+    Band-limited (trigonometric) interpolation of uniform samples
+
+    The samples are treated as one period of a band-limited signal, so the result
+    is exact for periodic signals whose frequencies are below fs / 2. The price is
+    a periodic wrap-around: towards either end the interpolant is pulled towards
+    the samples at the other end, which shows as ringing at the edges of signals
+    that are not periodic over the sampled span.
+
+    The spectrum is zero-padded to a grid `upsampling` times finer than the sample
+    period and read off with linear interpolation, which bounds the error by about
+    (pi / upsampling) ** 2 / 8 of the amplitude at the Nyquist frequency (about 3e-4
+    for the default, far less for content well below it), whatever the output grid.
+    The cost is one inverse FFT of that grid plus O(len(x_interp)).
+
+    Args:
+        x_known (ndarray): Uniformly spaced sample instants
+        y_known (ndarray): Sample values
+        x_interp (ndarray): Points to interpolate at
+        upsampling (int): Dense grid points per sample period
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    n = len(x_known)
+    period = sampling_period(x_known)
+    spectrum = np.fft.rfft(y_known)
+
+    dense_length = n * upsampling
+    padded = np.zeros(dense_length // 2 + 1, dtype=complex)
+    padded[:len(spectrum)] = spectrum
+    if n % 2 == 0 and upsampling > 1:
+        # Split the Nyquist bin between the positive and negative frequencies
+        padded[n // 2] *= 0.5
+    dense = np.fft.irfft(padded, n=dense_length) * upsampling
+
+    dense_time = np.arange(dense_length) * (period / upsampling)
+    return np.interp(x_interp - x_known[0], dense_time, dense, period=n * period)
+
+
+def sinc_kernel(x_known, y_known, x_interp, half_width=32, window="hann"):
+    """
+    Truncated, windowed Whittaker-Shannon sum
+
+    Each output point only sums the 2 * half_width nearest samples, so time and memory
+    are O(M * K) instead of the O(M * N) of the dense sinc matrix. Output points are
+    processed in chunks to bound the size of the weight matrix. Non-uniform samples
+    are mapped to a uniform index axis first, as for Lanczos.
+
+    Args:
+        x_known (ndarray): Sample instants (sorted)
+        y_known (ndarray): Sample values
+        x_interp (ndarray): Points to interpolate at
+        half_width (int): Number of samples used on each side of every output point
+        window (str): Taper applied to the kernel ("hann", "lanczos" or "rect")
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    if window not in SINC_WINDOWS:
+        raise ValueError(f"Unknown sinc window '{window}'.")
+    taper = SINC_WINDOWS[window]
+
+    n = len(x_known)
+    if is_uniform(x_known):
+        position = (x_interp - x_known[0]) / sampling_period(x_known)
+    else:
+        position = np.interp(x_interp, x_known, np.arange(n))
+    offsets = np.arange(-half_width + 1, half_width + 1)
+    chunk = max(1, KERNEL_CHUNK_ELEMENTS // len(offsets))
+
+    y_interp = np.empty(len(x_interp))
+    for start in range(0, len(x_interp), chunk):
+        p = position[start:start + chunk]
+        indices = np.floor(p).astype(np.intp)[:, None] + offsets[None, :]
+        valid = (indices >= 0) & (indices < n)
+        indices = np.clip(indices, 0, n - 1)
+
+        distance = p[:, None] - indices
+        weights = np.sinc(distance) * taper(np.clip(distance / half_width, -1, 1))
+        weights[~valid] = 0
+        y_interp[start:start + chunk] = np.sum(weights * y_known[indices], axis=1)
+
+    return y_interp
+
+
+def hold_indices(x_known, x_interp, centered=False):
+    """
+    Index of the sample held at every output point
+
+    Uniform samples are located with integer arithmetic, which is linear in the number
+    of output points; non-uniform samples fall back to a binary search.
+
+    Args:
+        x_known (ndarray): Sample instants (sorted)
+        x_interp (ndarray): Output points
+        centered (bool): Hold each sample over the interval centred on it instead of
+            the interval starting at it
+
+    Returns:
+        ndarray: Sample index for every output point
+    """
+    n = len(x_known)
+    if is_uniform(x_known):
+        position = (x_interp - x_known[0]) / sampling_period(x_known)
+        # Small tolerance so output points that land exactly on a sample hold that sample
+        indices = np.floor(position + (0.5 if centered else 1e-9)).astype(np.intp)
+    elif centered:
+        indices = np.searchsorted((x_known[:-1] + x_known[1:]) / 2, x_interp, side='right')
+    else:
+        indices = np.searchsorted(x_known, x_interp, side='right') - 1
+    return np.clip(indices, 0, n - 1)
+
+
+def hold_reconstruction(x_known, y_known, x_interp, order=0, alignment="causal"):
+    """
+    Hold/step family reconstruction
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to reconstruct at
+        order (int): 0 holds the sample value, 1 holds the slope through it
+        alignment (str): "causal" only uses samples at or before each output point
+            (classic ZOH / predictive FOH); "centered" holds each sample around its
+            own instant (nearest sample / straight lines between samples)
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    if alignment not in ("causal", "centered"):
+        raise ValueError(f"Unknown hold alignment '{alignment}'.")
+
+    if order == 0:
+        return y_known[hold_indices(x_known, x_interp, centered=alignment == "centered")]
+
+    if order == 1:
+        indices = hold_indices(x_known, x_interp)
+        if alignment == "causal":
+            # Extend the slope of the last two samples past the current one
+            indices = np.maximum(indices, 1)
+            previous = indices - 1
+        else:
+            # Draw a straight line from the current sample to the next one
+            indices = np.minimum(indices, len(x_known) - 2)
+            previous = indices
+            indices = indices + 1
+        slope = (y_known[indices] - y_known[previous]) / (x_known[indices] - x_known[previous])
+        anchor = previous if alignment == "centered" else indices
+        return y_known[anchor] + slope * (x_interp - x_known[anchor])
+
+    raise ValueError(f"Unsupported hold order {order}.")
+
+
+@register_method("Zero Order Hold")
+def zero_order_hold(x_known, y_known, x_interp, alignment="causal"):
+    """
+    Perform zero-order hold reconstruction
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to reconstruct at
+        alignment (str): "causal" or "centered"
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    return hold_reconstruction(x_known, y_known, x_interp, order=0, alignment=alignment)
+
+
+@register_method("First Order Hold")
+def first_order_hold(x_known, y_known, x_interp, alignment="causal"):
+    """
+    Perform first-order hold reconstruction
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to reconstruct at
+        alignment (str): "causal" or "centered"
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    return hold_reconstruction(x_known, y_known, x_interp, order=1, alignment=alignment)
+
+
+@register_method("Nearest Neighbor")
+def nearest_neighbor_interpolation(x_known, y_known, x_interp):
+    """
+    Perform nearest neighbor interpolation
+
+    Args:
+        x_known (ndarray): Known x values
+        y_known (ndarray): Known y values
+        x_interp (ndarray): Points to interpolate at
+
+    Returns:
+        ndarray: Reconstructed y values
+    """
+    return fit_nearest_neighbor(x_known, y_known)(x_interp)
+
+
+@register_fitter("Nearest Neighbor")
+def fit_nearest_neighbor(x_known, y_known):
+    """Fit a nearest neighbor interpolant that extrapolates past the samples."""
+    from scipy.interpolate import interp1d
+    return interp1d(x_known, y_known, kind='nearest', fill_value='extrapolate')
+
+
+# Number of fractional offsets per sample period in the precomputed Lanczos weight tables
+LANCZOS_TABLE_RESOLUTION = 1024
+
+# Supported Lanczos orders, each registered as its own reconstruction method
+LANCZOS_ORDERS = (2, 3, 4)
+
+
+@functools.lru_cache(maxsize=None)
+def lanczos_table(a, resolution=LANCZOS_TABLE_RESOLUTION):
+    """
+    Lanczos-a weights of the 2a nearest samples for evenly spaced fractional offsets
+
+    Row r holds the weights for an output point r / resolution sample periods past
+    sample floor(position), for the taps floor(position) - a + 1 ... floor(position) + a.
+    Rows are normalized to sum to 1 so constant signals are reproduced exactly.
+
+    Args:
+        a (int): Order of the kernel (number of lobes on each side)
+        resolution (int): Number of table rows per sample period
+
+    Returns:
+        ndarray: Read-only (resolution + 1, 2a) weight table
+    """
+    fractions = np.arange(resolution + 1) / resolution
+    taps = np.arange(-a + 1, a + 1)
+    distance = fractions[:, None] - taps[None, :]
+    weights = np.sinc(distance) * np.sinc(distance / a)
+    weights /= weights.sum(axis=1, keepdims=True)
+    weights.setflags(write=False)
+    return weights
+
+
+def lanczos_interpolation(x_known, y_known, x_interp, a=3):
+    """
+    Lanczos-a reconstruction from a precomputed weight table
+
+    Every output point is a weighted sum of its 2a nearest samples, with weights
+    looked up from lanczos_table instead of evaluating the kernel, so the cost is
+    O(len(x_interp) * a). Outside the samples the edge values are repeated.
+    Non-uniform samples are mapped to a uniform index axis first.
+
+    Args:
+        x_known (ndarray): Original sample points (sorted)
+        y_known (ndarray): Original sample values
+        x_interp (ndarray): Points to interpolate at
+        a (int): Lanczos order, one of LANCZOS_ORDERS
+
+    Returns:
+        ndarray: Interpolated amplitude array
+    """
+    if a not in LANCZOS_ORDERS:
+        raise ValueError(f"Unsupported Lanczos order {a}, expected one of {LANCZOS_ORDERS}.")
+    table = lanczos_table(a)
+    resolution = len(table) - 1
+
+    n = len(x_known)
+    if is_uniform(x_known):
+        position = (x_interp - x_known[0]) / sampling_period(x_known)
+    else:
+        position = np.interp(x_interp, x_known, np.arange(n))
+    taps = np.arange(-a + 1, a + 1)
+    chunk = max(1, KERNEL_CHUNK_ELEMENTS // len(taps))
+
+    y_interp = np.empty(len(x_interp))
+    for start in range(0, len(x_interp), chunk):
+        p = position[start:start + chunk]
+        base = np.floor(p)
+        rows = np.rint((p - base) * resolution).astype(np.intp)
+        indices = np.clip(base.astype(np.intp)[:, None] + taps[None, :], 0, n - 1)
+        y_interp[start:start + chunk] = np.einsum('ij,ij->i', table[rows], y_known[indices])
+    return y_interp
+
+
+for _a in LANCZOS_ORDERS:
+    register_method(f"Lanczos (a={_a})", min_samples=2)(functools.partial(lanczos_interpolation, a=_a))
+del _a
+
+
+@register_method("cubic", min_samples=4)
+def cubic_interpolation(x_known, y_known, x_interp):
+    """
+    Perform cubic spline interpolation
+
+    Args:
+        x_known (ndarray): Known x (time) values
+        y_known (ndarray): Known y (amplitude) values
+        x_interp (ndarray): Points to interpolate at
+
+    Returns:
+        ndarray: Interpolated amplitude array
+    """
+    return fit_cubic(x_known, y_known)(x_interp)
+
+
+@register_fitter("cubic")
+def fit_cubic(x_known, y_known):
+    """Solve the cubic spline system through the samples."""
+    from scipy.interpolate import CubicSpline
+    return CubicSpline(x_known, y_known)
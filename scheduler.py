@@ -0,0 +1,122 @@
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+
+class _JobSignals(QObject):
+    """Signals a worker job uses to report back to the UI thread."""
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _RecomputeJob(QRunnable):
+    def __init__(self, generation, compute, args, kwargs):
+        super().__init__()
+        self.generation = generation
+        self.compute = compute
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _JobSignals()
+
+    def run(self):
+        args, kwargs = self.args, self.kwargs
+        # The scheduler keeps the job alive, don't let it pin the inputs too
+        self.args = self.kwargs = None
+        try:
+            result = self.compute(*args, **kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, e)
+        else:
+            self.signals.finished.emit(self.generation, result)
+
+
+class RecomputeScheduler(QObject):
+    """
+    Coalesce bursts of recompute requests and run them off the UI thread
+
+    Every request bumps a generation number and restarts a short debounce timer, so
+    dragging a slider only submits the latest inputs. The debounce never holds a
+    request back for more than max_wait_ms after the oldest request still pending,
+    so a continuous drag keeps updating instead of waiting for the pointer to rest.
+    At most one job runs at a time on a private thread pool, and a job that finishes
+    starts the pending request at once. Its result is emitted through result_ready
+    even when newer inputs are already pending, so the view follows the drag; only
+    results of jobs cancelled since they were requested are dropped. Errors are only
+    reported for the latest request.
+    """
+    result_ready = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+    def __init__(self, compute, delay_ms=30, max_wait_ms=100, parent=None):
+        super().__init__(parent)
+        self.compute = compute
+        self.delay_ms = delay_ms
+        self.max_wait_ms = max_wait_ms
+        self.generation = 0
+        self.cancelled_generation = 0
+        self.pending = None
+        self.pending_since = None
+        self.running = False
+        self.current_job = None
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.dispatch)
+
+    def request(self, *args, **kwargs):
+        """Schedule a recompute with the given inputs, replacing any pending request."""
+        self.generation += 1
+        now = time.monotonic()
+        if self.pending is None:
+            self.pending_since = now
+        self.pending = (self.generation, args, kwargs)
+        remaining_ms = self.max_wait_ms - (now - self.pending_since) * 1000
+        if remaining_ms <= 0:
+            # Waited long enough; a running job picks the request up when it finishes
+            self.timer.stop()
+            self.dispatch()
+        else:
+            self.timer.start(int(min(self.delay_ms, remaining_ms)))
+
+    def cancel(self):
+        """Drop the pending request and ignore the result of any running job."""
+        self.generation += 1
+        self.cancelled_generation = self.generation
+        self.pending = None
+        self.timer.stop()
+
+    def dispatch(self):
+        """Start the pending request on the worker, unless a job is still running."""
+        if self.pending is None or self.running:
+            return
+        generation, args, kwargs = self.pending
+        self.pending = None
+        self.running = True
+
+        job = _RecomputeJob(generation, self.compute, args, kwargs)
+        job.signals.finished.connect(self.on_finished)
+        job.signals.failed.connect(self.on_failed)
+        # Keep a reference so the signals object outlives the runnable
+        self.current_job = job
+        self.pool.start(job)
+
+    def on_finished(self, generation, result):
+        self.running = False
+        if generation > self.cancelled_generation:
+            self.result_ready.emit(result)
+        self.dispatch()
+
+    def on_failed(self, generation, exception):
+        self.running = False
+        if generation == self.generation:
+            self.error.emit(exception)
+        self.dispatch()
+
+    def wait_for_done(self, msecs=-1):
+        """Block until the worker is idle (used on shutdown)."""
+        self.timer.stop()
+        self.pending = None
+        return self.pool.waitForDone(msecs)
@@ -0,0 +1,211 @@
+import atexit
+import sys
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArray:
+    """
+    NumPy array backed by a named shared-memory block
+
+    The creating process owns the block and unlinks it when done. Worker processes
+    attach to it by its spec (name, shape and dtype), which pickles to a few bytes,
+    and get a view of the same memory without copying the data.
+    """
+
+    def __init__(self, shape, dtype=np.float64, name=None):
+        """
+        Args:
+            shape (tuple): Shape of the array
+            dtype (type): Element type
+            name (str): Name of an existing block to attach to; a new block is
+                created when None
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(shape)
+        if name is None:
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            self.shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            self.owner = True
+            self.refs = 1
+        else:
+            # Python 3.13+ can skip registering attached blocks with the resource
+            # tracker, which would otherwise treat them as leaked by the worker
+            kwargs = {"track": False} if sys.version_info >= (3, 13) else {}
+            self.shm = shared_memory.SharedMemory(name=name, **kwargs)
+            self.owner = False
+            self.refs = 0
+        # frombuffer keeps the buffer exported for as long as any view of the array
+        # exists, so the mapping cannot be closed underneath a live array
+        count = int(np.prod(shape))
+        self.array = np.frombuffer(self.shm.buf, dtype=dtype, count=count).reshape(shape)
+
+    @classmethod
+    def from_array(cls, values):
+        """Create a shared copy of an array."""
+        values = np.asarray(values)
+        shared = cls(values.shape, values.dtype)
+        shared.array[...] = values
+        return shared
+
+    @classmethod
+    def attach(cls, spec):
+        """Attach to the block described by a spec from another process."""
+        name, shape, dtype = spec
+        return cls(shape, dtype, name=name)
+
+    @property
+    def spec(self):
+        """Picklable (name, shape, dtype) description of the block."""
+        return self.shm.name, self.array.shape, self.array.dtype.str
+
+    def unlink(self):
+        """Remove the block's name so no other process can attach to it."""
+        if self.owner:
+            self.shm.unlink()
+            self.owner = False
+
+    def close(self):
+        """
+        Free the block if this process created it and release this process' mapping
+
+        Raises BufferError while other arrays still view the mapping; the name is
+        already removed by then, and close() can be retried once they are gone.
+        """
+        self.unlink()
+        # Drop the own view first, the mapping cannot be closed while it is exported
+        self.array = None
+        self.shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SharedBufferStore:
+    """
+    Reference-counted set of named shared-memory arrays
+
+    put() copies an array into a new block under a key and returns the shared
+    array; putting the same key again replaces it. allocate() hands out an empty
+    block to be filled in place, so data can be produced straight into shared
+    memory without an intermediate copy. A consumer that hands an array
+    to worker processes acquire()s its block, so the block outlives a replacement
+    until the consumer release()s it. Blocks that reach zero references are
+    unlinked at once and their mapping is closed as soon as no array in this
+    process views it anymore. Everything is freed by close(), which also runs at exit.
+    """
+
+    def __init__(self):
+        self.blocks = {}
+        self.retired = []
+        self.lock = threading.Lock()
+        atexit.register(self.close)
+
+    def put(self, key, values):
+        """
+        Store a shared copy of an array under a key
+
+        Args:
+            key (str): Name of the buffer, e.g. "combined"
+            values (array-like): Values to copy
+
+        Returns:
+            ndarray: The shared array
+        """
+        block = SharedArray.from_array(values)
+        self._store(key, block)
+        return block.array
+
+    def allocate(self, key, shape, dtype=np.float64):
+        """
+        Store a new, uninitialized shared array under a key
+
+        Args:
+            key (str): Name of the buffer
+            shape (tuple): Shape of the array
+            dtype (type): Element type
+
+        Returns:
+            ndarray: The shared array, to be filled by the caller
+        """
+        block = SharedArray(shape, dtype)
+        self._store(key, block)
+        return block.array
+
+    def _store(self, key, block):
+        """Register a block under a key, replacing the previous one."""
+        with self.lock:
+            previous = self.blocks.get(key)
+            self.blocks[key] = block
+            if previous is not None:
+                self.drop(previous)
+            self.collect()
+
+    def get(self, key):
+        """Return the shared array stored under a key, or None."""
+        with self.lock:
+            block = self.blocks.get(key)
+            return None if block is None else block.array
+
+    def discard(self, key):
+        """Forget the array stored under a key."""
+        with self.lock:
+            block = self.blocks.pop(key, None)
+            if block is not None:
+                self.drop(block)
+            self.collect()
+
+    def acquire(self, array):
+        """
+        Keep the block behind a shared array alive while workers use it
+
+        Args:
+            array (ndarray): An array returned by put()
+
+        Returns:
+            SharedArray: The block (pass its spec to the workers), or None if the
+                array is not one of the stored arrays
+        """
+        with self.lock:
+            for block in self.blocks.values():
+                if block.array is array:
+                    block.refs += 1
+                    return block
+        return None
+
+    def release(self, block):
+        """Give back a block obtained from acquire()."""
+        with self.lock:
+            self.drop(block)
+            self.collect()
+
+    def drop(self, block):
+        """Remove one reference to a block, retiring it at zero."""
+        block.refs -= 1
+        if block.refs == 0:
+            block.unlink()
+            self.retired.append(block)
+
+    def collect(self):
+        """Close the mappings of unlinked blocks that are no longer viewed."""
+        still_viewed = []
+        for block in self.retired:
+            try:
+                block.close()
+            except BufferError:
+                still_viewed.append(block)
+        self.retired = still_viewed
+
+    def close(self):
+        """Free every block."""
+        with self.lock:
+            for block in self.blocks.values():
+                block.refs = 1
+                self.drop(block)
+            self.blocks.clear()
+            self.collect()
@@ -0,0 +1,268 @@
+import argparse
+import json
+import os
+import struct
+
+import numpy as np
+
+from timebase import UniformTimeBase, as_time_base
+
+
+class LoadCancelled(Exception):
+    """Raised when the user cancels loading a signal file."""
+
+
+def count_rows(file_path, block_size=1 << 20):
+    """Count the lines of a text file without parsing it."""
+    rows = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            rows += block.count(b"\n")
+            last = block[-1:]
+    # A last line without a trailing newline still counts
+    return rows + (last != b"\n")
+
+
+def first_value(column):
+    """Return the first non-missing value of a metadata column, or None."""
+    values = column.dropna()
+    if not len(values):
+        return None
+    value = values.iloc[0]
+    # Numeric columns give NumPy scalars, text columns plain str
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def load_csv_signal(file_path, chunksize=1_000_000, dtype=np.float64, progress=None, is_cancelled=None,
+                    allocate=None):
+    """
+    Load a signal from a CSV/TXT file in chunks
+
+    The first two columns are time and amplitude. They are parsed chunk by chunk
+    straight into preallocated contiguous arrays, so peak memory stays close to the
+    size of the final arrays. An evenly spaced time column is replaced by a
+    UniformTimeBase and its array freed. Columns 3 and 4, when present, hold the
+    frequency and amplitude shown in the signal info table.
+
+    Args:
+        file_path (str): Path of the file
+        chunksize (int): Number of rows parsed at a time
+        dtype (type): Floating point type of the time and amplitude arrays
+        progress (callable): Called with the fraction of rows loaded after each chunk
+        is_cancelled (callable): Polled after each chunk; loading stops with
+            LoadCancelled when it returns True
+        allocate (callable): allocate(length, dtype) -> writable array the amplitudes
+            are parsed into, e.g. a block of a SharedBufferStore. Defaults to np.empty
+
+    Returns:
+        dict: time (UniformTimeBase or array), amplitude, frequency and
+            amplitude_value (the last two are None when the file has no metadata columns)
+    """
+    # pandas takes a noticeable time to import, so it is only loaded once a CSV is opened
+    import pandas as pd
+
+    columns = pd.read_csv(file_path, nrows=0).columns
+    if len(columns) < 2:
+        raise ValueError(f"CSV file '{file_path}' must contain at least two columns: time and amplitude.")
+
+    # Minus the header row
+    expected_rows = max(count_rows(file_path) - 1, 0)
+    if allocate is None:
+        allocate = np.empty
+    time = np.empty(expected_rows, dtype=dtype)
+    amplitude = allocate(expected_rows, dtype)
+    frequency = None
+    amplitude_value = None
+
+    usecols = list(range(min(len(columns), 4)))
+    rows = 0
+    reader = pd.read_csv(file_path, usecols=usecols, chunksize=chunksize,
+                         dtype={columns[0]: dtype, columns[1]: dtype})
+    for chunk in reader:
+        end = rows + len(chunk)
+        if end > len(time):
+            # The line count was an underestimate (e.g. quoted line breaks), grow the buffers
+            time = np.resize(time, max(end, 2 * len(time)))
+            grown = allocate(len(time), dtype)
+            grown[:rows] = amplitude[:rows]
+            amplitude = grown
+        time[rows:end] = chunk.iloc[:, 0].to_numpy(dtype=dtype)
+        amplitude[rows:end] = chunk.iloc[:, 1].to_numpy(dtype=dtype)
+        rows = end
+
+        if frequency is None and len(usecols) > 2:
+            frequency = first_value(chunk.iloc[:, 2])
+        if amplitude_value is None and len(usecols) > 3:
+            amplitude_value = first_value(chunk.iloc[:, 3])
+
+        if progress is not None:
+            progress(min(rows / expected_rows, 1.0) if expected_rows else 1.0)
+        if is_cancelled is not None and is_cancelled():
+            raise LoadCancelled(f"Loading '{file_path}' was cancelled.")
+
+    if rows == 0:
+        raise ValueError(f"'{file_path}' has no data rows.")
+    return {
+        "time": as_time_base(time[:rows]),
+        "amplitude": amplitude[:rows],
+        "frequency": frequency,
+        "amplitude_value": amplitude_value,
+    }
+
+
+# Binary signal container:
+#   8 bytes   magic
+#   4 bytes   little-endian uint32 header length
+#   header    UTF-8 JSON, space-padded so the samples start on a 64-byte boundary
+#   samples   raw time values (only for non-uniform signals) followed by the amplitudes
+BINARY_MAGIC = b"SIGSTUD1"
+BINARY_EXTENSION = ".sig"
+BINARY_ALIGNMENT = 64
+BINARY_VERSION = 1
+
+
+def uniform_sample_rate(time, rtol=1e-6):
+    """Return the sample rate of an evenly spaced time base or array, or None."""
+    if not isinstance(time, UniformTimeBase):
+        time = UniformTimeBase.from_array(time, rtol=rtol)
+    return None if time is None or time.step <= 0 else time.sample_rate
+
+
+def save_binary_signal(file_path, amplitude, time, components=(), dtype=None):
+    """
+    Write a signal to the binary container
+
+    Uniformly sampled signals only store their sample rate and start time; other
+    signals also store the raw time values.
+
+    Args:
+        file_path (str): Destination path
+        amplitude (array-like): Signal values
+        time (array-like): Time base of the signal
+        components (iterable): Component metadata, dicts with name, frequency and amplitude
+        dtype (type): Storage type of the samples, defaults to the amplitude's type
+    """
+    amplitude = np.asarray(amplitude)
+    if not isinstance(time, UniformTimeBase):
+        time = np.asarray(time)
+    dtype = np.dtype(dtype or amplitude.dtype).newbyteorder("<")
+    sample_rate = uniform_sample_rate(time)
+
+    header = {
+        "version": BINARY_VERSION,
+        "dtype": dtype.str,
+        "length": len(amplitude),
+        "sample_rate": sample_rate,
+        "start_time": float(time[0]) if len(time) else 0.0,
+        "has_time": sample_rate is None,
+        "components": [
+            {"name": c.get("name"), "frequency": c.get("frequency"), "amplitude": c.get("amplitude")}
+            for c in components
+        ],
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix = len(BINARY_MAGIC) + 4
+    padding = -(prefix + len(header_bytes)) % BINARY_ALIGNMENT
+    header_bytes += b" " * padding
+
+    with open(file_path, "wb") as f:
+        f.write(BINARY_MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        if header["has_time"]:
+            np.asarray(time).astype(dtype, copy=False).tofile(f)
+        amplitude.astype(dtype, copy=False).tofile(f)
+
+
+def read_binary_header(file_path):
+    """Return the JSON header of a binary signal file and the offset of its samples."""
+    with open(file_path, "rb") as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"'{file_path}' is not a signal file.")
+        (header_length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    if header.get("version") != BINARY_VERSION:
+        raise ValueError(f"Unsupported signal file version {header.get('version')}.")
+    return header, len(BINARY_MAGIC) + 4 + header_length
+
+
+def load_binary_signal(file_path, mode="r"):
+    """
+    Open a binary signal file without reading its samples
+
+    The amplitudes (and stored time values) are returned as np.memmap views and a
+    uniform time base as a UniformTimeBase, so opening is effectively instant
+    regardless of the file size.
+
+    Args:
+        file_path (str): Path of the file
+        mode (str): Memory-map mode, "r" for read-only or "c" for copy-on-write
+
+    Returns:
+        dict: time, amplitude, frequency, amplitude_value (from the first component),
+            sample_rate, start_time and components
+    """
+    header, offset = read_binary_header(file_path)
+    dtype = np.dtype(header["dtype"])
+    length = header["length"]
+
+    if header["has_time"]:
+        time = np.memmap(file_path, dtype=dtype, mode=mode, offset=offset, shape=(length,))
+        offset += length * dtype.itemsize
+    else:
+        time = UniformTimeBase(header["start_time"], 1 / header["sample_rate"], length)
+    amplitude = np.memmap(file_path, dtype=dtype, mode=mode, offset=offset, shape=(length,))
+
+    components = header["components"]
+    return {
+        "time": time,
+        "amplitude": amplitude,
+        "frequency": components[0]["frequency"] if components else None,
+        "amplitude_value": components[0]["amplitude"] if components else None,
+        "sample_rate": header["sample_rate"],
+        "start_time": header["start_time"],
+        "components": components,
+    }
+
+
+def load_signal(file_path, **kwargs):
+    """
+    Load a signal file, choosing the reader from its extension
+
+    kwargs (progress, is_cancelled, allocate, ...) are forwarded to load_csv_signal;
+    binary files are memory-mapped and ignore them.
+    """
+    if file_path.lower().endswith(BINARY_EXTENSION):
+        return load_binary_signal(file_path)
+    return load_csv_signal(file_path, **kwargs)
+
+
+def convert_csv_to_binary(csv_path, binary_path, dtype=np.float64, **kwargs):
+    """
+    Convert a CSV/TXT signal file to the binary container
+
+    Args:
+        csv_path (str): Source CSV/TXT file
+        binary_path (str): Destination binary file
+        dtype (type): Storage type of the samples
+        **kwargs: Forwarded to load_csv_signal (chunksize, progress, is_cancelled)
+    """
+    data = load_csv_signal(csv_path, dtype=dtype, **kwargs)
+    components = []
+    if data["frequency"] is not None or data["amplitude_value"] is not None:
+        name = os.path.splitext(os.path.basename(csv_path))[0]
+        components.append({"name": name, "frequency": data["frequency"], "amplitude": data["amplitude_value"]})
+    save_binary_signal(binary_path, data["amplitude"], data["time"], components=components, dtype=dtype)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a CSV/TXT signal file to the binary signal format.")
+    parser.add_argument("csv_path")
+    parser.add_argument("binary_path")
+    parser.add_argument("--float32", action="store_true", help="Store samples as float32 instead of float64")
+    args = parser.parse_args()
+    convert_csv_to_binary(args.csv_path, args.binary_path, dtype=np.float32 if args.float32 else np.float64)
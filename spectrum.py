@@ -0,0 +1,60 @@
+import numpy as np
+
+
+# Windows offered in the Frequency Viewer, mapped to scipy.signal window names
+SPECTRUM_WINDOWS = {
+    "Hann": "hann",
+    "Hamming": "hamming",
+    "Blackman": "blackman",
+    "Rectangular": "boxcar",
+}
+
+
+def compute_spectrum(amplitude, sample_spacing, window="Hann", welch_segment=None):
+    """
+    One-sided magnitude spectrum of a real signal
+
+    Uses rfft at the next fast FFT length, which needs half the work and memory of
+    a full complex FFT. With welch_segment, overlapping windowed segments of that
+    length are averaged (Welch's method), which smooths the spectrum of long
+    captures and bounds the FFT size.
+
+    Args:
+        amplitude (array-like): Real signal values
+        sample_spacing (float): Time between consecutive samples
+        window (str): Name of a window in SPECTRUM_WINDOWS
+        welch_segment (int): Segment length for Welch averaging, or None for a
+            single FFT over the whole signal
+
+    Returns:
+        tuple: Frequencies (Hz) and magnitudes normalized to a peak of 1
+    """
+    # Imported here so starting the GUI, which opens on the bandwidth view, does not load them
+    import scipy.fft
+    import scipy.signal
+
+    amplitude = np.asarray(amplitude, dtype=float)
+    n = len(amplitude)
+    window_name = SPECTRUM_WINDOWS[window]
+
+    if welch_segment is not None and n > welch_segment:
+        freqs, power = scipy.signal.welch(amplitude, fs=1 / sample_spacing, window=window_name,
+                                          nperseg=welch_segment, nfft=scipy.fft.next_fast_len(welch_segment),
+                                          scaling="spectrum")
+        magnitude = np.sqrt(power)
+    else:
+        taper = scipy.signal.get_window(window_name, n)
+        n_fft = scipy.fft.next_fast_len(n, real=True)
+        magnitude = np.abs(scipy.fft.rfft(amplitude * taper, n=n_fft))
+        freqs = scipy.fft.rfftfreq(n_fft, d=sample_spacing)
+
+    peak = magnitude.max()
+    if peak > 0:
+        magnitude = magnitude / peak
+    return freqs, magnitude
+
+
+def two_sided(freqs, magnitude):
+    """Mirror a one-sided spectrum of a real signal onto the negative frequencies."""
+    return (np.concatenate([-freqs[:0:-1], freqs]),
+            np.concatenate([magnitude[:0:-1], magnitude]))
@@ -0,0 +1,158 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import reconstruction
+from pipeline import output_grid, take_samples
+from shared_buffers import SharedArray
+from timebase import UniformTimeBase
+
+
+SWEEP_COLUMNS = ["method", "sampling_frequency", "snr", "rmse", "max_error", "reconstruction_snr"]
+
+# Signal shared by the points of a sweep, set once per worker process by init_worker
+_signal = {}
+
+
+def set_signal(time, clean, unit_noise):
+    """Store the signal of the sweep in this process."""
+    _signal["time"] = time if isinstance(time, UniformTimeBase) else np.asarray(time, dtype=float)
+    _signal["clean"] = np.asarray(clean, dtype=float)
+    _signal["unit_noise"] = np.asarray(unit_noise, dtype=float)
+    _signal["power"] = np.mean(_signal["clean"] ** 2)
+
+
+def init_worker(time, clean_spec, unit_noise_spec):
+    """
+    Attach a worker process to the shared-memory signal of the sweep
+
+    Args:
+        time (tuple or UniformTimeBase): Spec of the time array, or a uniform time
+            base, which is passed by value
+        clean_spec, unit_noise_spec (tuple): Specs of the clean signal and the noise
+    """
+    specs = [clean_spec, unit_noise_spec]
+    if not isinstance(time, UniformTimeBase):
+        specs.append(time)
+    # Kept for the lifetime of the worker so the mappings stay open
+    _signal["blocks"] = [SharedArray.attach(spec) for spec in specs]
+    if len(specs) > 2:
+        time = _signal["blocks"][2].array
+    set_signal(time, _signal["blocks"][0].array, _signal["blocks"][1].array)
+
+
+def share(values, buffers=None):
+    """Return a shared block holding values, and whether it was borrowed from the store."""
+    block = buffers.acquire(values) if buffers is not None else None
+    if block is not None:
+        return block, True
+    return SharedArray.from_array(np.asarray(values, dtype=float)), False
+
+
+def sweep_point(method, sampling_frequency, snrs):
+    """
+    Reconstruction errors of one method at one sampling frequency, for every SNR
+
+    Every registered method is linear in the sample values, so the reconstruction
+    of clean + gain * noise is the reconstruction of the clean samples plus gain
+    times that of the noise samples. Two reconstructions therefore cover all SNRs,
+    and the errors of all of them are computed as one (snr, time) array.
+
+    Args:
+        method (str): Name of a registered reconstruction method
+        sampling_frequency (float): Sampling frequency in Hz
+        snrs (array-like): Signal-to-noise ratios in dB
+
+    Returns:
+        list: One row (method, sampling_frequency, snr, rmse, max_error,
+            reconstruction_snr) per SNR; NaN errors when the method cannot run
+    """
+    time, clean = _signal["time"], _signal["clean"]
+    snrs = np.asarray(snrs, dtype=float)
+    samples, sampled_clean = take_samples(time, clean, sampling_frequency)
+    _, sampled_noise = take_samples(time, _signal["unit_noise"], sampling_frequency)
+
+    # Only score the part of the time base the samples cover, not the extrapolated tail
+    grid = output_grid(time, samples)
+    covered = time[grid]
+    try:
+        _, clean_part = reconstruction.reconstruct(samples, sampled_clean, out_t=covered, method=method)
+        _, noise_part = reconstruction.reconstruct(samples, sampled_noise, out_t=covered, method=method)
+    except ValueError:
+        nan = np.full(len(snrs), np.nan)
+        rmse = max_error = reconstruction_snr = nan
+    else:
+        gains = np.sqrt(_signal["power"] / 10 ** (snrs / 10))
+        error = clean[grid] - clean_part - gains[:, np.newaxis] * noise_part
+        mean_square = np.mean(error ** 2, axis=1)
+        rmse = np.sqrt(mean_square)
+        max_error = np.max(np.abs(error), axis=1)
+        with np.errstate(divide="ignore"):
+            reconstruction_snr = 10 * np.log10(_signal["power"] / mean_square)
+
+    return [(method, float(sampling_frequency), float(snr), float(r), float(m), float(s))
+            for snr, r, m, s in zip(snrs, rmse, max_error, reconstruction_snr)]
+
+
+def run_sweep(time, clean, sampling_frequencies, snrs, methods=None, unit_noise=None, max_workers=None,
+              buffers=None):
+    """
+    Evaluate reconstruction methods over a grid of sampling frequencies and SNRs
+
+    The (method, sampling frequency) points are spread over a process pool. The
+    signal is handed to the workers in shared memory: arrays held by `buffers` are
+    borrowed, anything else is copied into a block once, and every worker attaches
+    to the blocks by name when it starts.
+
+    Args:
+        time (UniformTimeBase or array-like): Time base of the signal
+        clean (array-like): Clean signal values
+        sampling_frequencies (array-like): Sampling frequencies in Hz
+        snrs (array-like): Signal-to-noise ratios in dB
+        methods (list): Reconstruction methods, defaults to every registered one
+        unit_noise (array-like): Unit-variance noise on the time base, scaled to each
+            SNR. Defaults to a fixed seeded realization
+        max_workers (int): Number of worker processes; 1 runs in this process
+        buffers (SharedBufferStore): Store whose arrays are passed without copying
+
+    Returns:
+        DataFrame: One row per (method, sampling frequency, SNR) with rmse,
+            max_error and reconstruction_snr (in dB)
+    """
+    import pandas as pd
+
+    if methods is None:
+        methods = reconstruction.available_methods()
+    if unit_noise is None:
+        unit_noise = np.random.default_rng(0).standard_normal(len(time))
+    snrs = list(snrs)
+    points = [(method, fs) for method in methods for fs in sampling_frequencies]
+
+    if not points:
+        return pd.DataFrame(columns=SWEEP_COLUMNS)
+    if max_workers == 1:
+        set_signal(time, clean, unit_noise)
+        results = [sweep_point(method, fs, snrs) for method, fs in points]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        uniform = isinstance(time, UniformTimeBase)
+        shared = (clean, unit_noise) if uniform else (clean, unit_noise, time)
+        inputs = [share(values, buffers) for values in shared]
+        try:
+            specs = [block.spec for block, _ in inputs]
+            time_arg = time if uniform else specs[2]
+            # spawn keeps the workers free of the GUI's threads and Qt state
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=init_worker, initargs=(time_arg, specs[0], specs[1])) as executor:
+                results = list(executor.map(sweep_point, *zip(*points), [snrs] * len(points),
+                                            chunksize=max(len(points) // (4 * workers), 1)))
+        finally:
+            for block, borrowed in inputs:
+                if borrowed:
+                    buffers.release(block)
+                else:
+                    block.close()
+
+    return pd.DataFrame([row for rows in results for row in rows], columns=SWEEP_COLUMNS)
@@ -1,77 +1,144 @@
+import numbers
 import os
 import numpy as np
-import pandas as pd
 import pyqtgraph as pg
-import scipy
 from PyQt5.QtWidgets import QApplication, QHBoxLayout, QWidget, QPushButton, QVBoxLayout, QSlider, QComboBox, QLabel, \
     QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox, QLineEdit, QGroupBox, \
-    QSizePolicy, QScrollArea
-from PyQt5.QtCore import Qt
+    QSizePolicy, QScrollArea, QProgressDialog, QCheckBox
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon, QFont
 import sys
-
-from scipy.interpolate import interp1d
+import time
+from collections import deque
+
+import pipeline
+import reconstruction
+import aliasing
+import sweep
+from compare import MethodComparison
+from instrumentation import ProfileCapture, StageTimer, configure_logging, logger
+from shared_buffers import SharedBufferStore
+import signal_io
+from interpolant_cache import InterpolantCache
+from lod import MinMaxPyramid
+from noise import NoiseGenerator
+from scheduler import RecomputeScheduler
+from spectrum import SPECTRUM_WINDOWS
+from timebase import UniformTimeBase, time_step
+
+# Frequency viewer modes, mapped to the Welch segment length of the spectrum (None for a single FFT)
+FREQUENCY_VIEWS = {"Bandwidth": None, "Spectrum": None, "Spectrum (Welch)": 8192}
+# Images of the spectrum drawn around k * fs
+SPECTRUM_REPLICAS = (-2, -1, 1, 2)
 
 
 class Signal:
-    def __init__(self,name, amplitude, time, signal_id, signal_type, frequency=None):
+    def __init__(self,name, amplitude, time, signal_id, signal_type, frequency=None, amplitude_value=None, phase=0.0,
+                 components=None):
+        """
+        A signal component
+
+        Sinusoidal components are kept as (frequency, amplitude_value, phase) and
+        evaluated on demand; pass amplitude=None for those. Uploaded signals keep
+        their explicit amplitude values. time is a UniformTimeBase unless the
+        signal is not evenly sampled. components lists the component metadata
+        (name, frequency, amplitude) of an uploaded signal file that has it.
+        """
         self.name=name
-        self.amplitude = amplitude
+        self.values = amplitude
         self.time = time
         self.frequency = frequency
+        self.amplitude_value = amplitude_value
+        self.phase = phase
+        self.components = components or []
         self.signal_id = signal_id
         self.signal_type = signal_type
 
+    @property
+    def is_parametric(self):
+        """True when the component is defined in closed form rather than by stored values."""
+        return self.values is None
+
+    def evaluate(self, t):
+        """Evaluate the component at arbitrary instants."""
+        if self.values is None:
+            return self.amplitude_value * np.cos(2 * np.pi * self.frequency * np.asarray(t, dtype=float) + self.phase)
+        if t is self.time:
+            return np.asarray(self.values, dtype=float)
+        return np.interp(t, self.time, self.values)
+
 
 class SignalManager:
-    def __init__(self, plot_callback):
+    def __init__(self, plot_callback, seed=None, timer=None):
         self.signals = []
         self.next_signal_id = 1  # Start signal ID from 1
         self.plot_callback = plot_callback
         self.snr = 40  # Default SNR value
+        self.noise = NoiseGenerator(seed)
+        self.timer = StageTimer() if timer is None else timer
+
+        # A non-uniform time base, the running sum and uploaded values live in shared memory, so worker
+        # processes can attach to them by name instead of receiving pickled copies
+        self.buffers = SharedBufferStore()
+
+        # Running sum of all components on the shared time base, with its cached power.
+        # combined is replaced (never modified in place) so workers can keep reading
+        # the previous (time, amplitude, power) snapshot while it is being updated.
+        self.time = None
+        self.combined = None
 
     def upload_signal(self, parent):
-        """Upload and load signal data from CSV files."""
+        """Upload and load signal data from CSV or binary signal files."""
         file_paths, _ = QFileDialog.getOpenFileNames(
-            parent, "Select Signal Files", "", "CSV Files (*.csv);;Text Files (*.txt);;All Files (*)"
+            parent, "Select Signal Files", "",
+            "Signal Files (*.sig);;CSV Files (*.csv);;Text Files (*.txt);;All Files (*)"
         )
 
         if file_paths:
             for file_path in file_paths:
+                progress_dialog = QProgressDialog(f"Loading {os.path.basename(file_path)}...", "Cancel", 0, 100, parent)
+                progress_dialog.setWindowTitle("Loading Signal")
+                progress_dialog.setWindowModality(Qt.WindowModal)
+                progress_dialog.setMinimumDuration(500)
+                signal_id = self.next_signal_id
+                buffer_key = f"signal-{signal_id}"
                 try:
-                    data = pd.read_csv(file_path)
-                    if data.ndim == 1:
-                        data = data.reshape(-1, 1)  # Ensure 2D array
-
-                    if data.shape[1] < 2:
-                        QMessageBox.warning(
-                            parent, "Invalid Data",
-                            f"CSV file '{file_path}' must contain at least two columns: time and amplitude."
+                    with self.timer.measure("load"):
+                        # CSV amplitudes are parsed straight into shared memory; memory-mapped
+                        # binary files are already shareable
+                        data = signal_io.load_signal(
+                            file_path,
+                            progress=lambda fraction: progress_dialog.setValue(int(fraction * 100)),
+                            is_cancelled=progress_dialog.wasCanceled,
+                            allocate=lambda length, dtype: self.buffers.allocate(buffer_key, (length,), dtype),
                         )
-                        continue
-
-                    time = data.iloc[:, 0]   # Normalize time to start at zero
-                    amplitude = data.iloc[:, 1]
-                    frequency = data.iloc[:, 2]
-                    amp=data.iloc[:, 3]
-
-
 
                     signal_name = os.path.splitext(os.path.basename(file_path))[0]
 
 
-                    signal_id = self.next_signal_id
-                    signal = Signal(name=signal_name,signal_id=signal_id, time=time, amplitude=amplitude, signal_type="UPLOADED")
-                    parent.add_signal_to_table(signal_name,frequency[1],amp[1])
+                    signal = Signal(name=signal_name, signal_id=signal_id, time=data["time"],
+                                    amplitude=data["amplitude"], signal_type="UPLOADED",
+                                    frequency=data["frequency"], amplitude_value=data["amplitude_value"],
+                                    components=data.get("components"))
+                    parent.add_signal_to_table(signal_name, data["frequency"], data["amplitude_value"])
 
-                    self.signals.append(signal)
+                    self.append_signal(signal)
                     self.next_signal_id += 1
 
                     # Automatically plot after uploading
                     self.plot_callback()
 
+                except signal_io.LoadCancelled:
+                    continue
+                except ValueError as e:
+                    QMessageBox.warning(parent, "Invalid Data", str(e))
                 except Exception as e:
                     QMessageBox.critical(parent, "Error", f"Failed to load signal '{file_path}':\n{e}")
+                finally:
+                    progress_dialog.close()
+                    if self.next_signal_id == signal_id:
+                        # Not added, free the partially loaded amplitudes
+                        self.buffers.discard(buffer_key)
 
     def add_signal_component(self, frequency, amplitude_value,phase, parent):
         try:
@@ -86,15 +153,15 @@ class SignalManager:
                 time = self.signals[0].time
             else:
                 length = 1500
-                time = np.linspace(0, 6, length)  # Default time array with sampling rate 1500 Hz
+                time = UniformTimeBase.linspace(0, 6, length)  # Default time base with 1500 points
 
-            amplitude = amplitude_value * np.cos(2 * np.pi * frequency * time + phase)
             signal_name= f"freq{str(frequency)} amp{str(amplitude_value)}"
 
-            signal = Signal(name=signal_name,amplitude=amplitude, time=time, signal_id=signal_id, signal_type='sinusoidal', frequency=frequency)
+            signal = Signal(name=signal_name, amplitude=None, time=time, signal_id=signal_id,
+                            signal_type='sinusoidal', frequency=frequency, amplitude_value=amplitude_value, phase=phase)
             parent.add_signal_to_table(signal_name,str(frequency),str(amplitude_value))
 
-            self.signals.append(signal)
+            self.append_signal(signal)
             self.next_signal_id += 1
 
             # Automatically plot after adding a new signal component
@@ -108,35 +175,229 @@ class SignalManager:
         """Set the SNR value for noise addition."""
         self.snr = snr_value
 
-    def get_combined_signal_with_noise(self):
-        """Combine all signals and add noise based on the current SNR value."""
-        if not self.signals:
-            return None, None
-
-        time = self.signals[0].time
-        combined_amplitude = np.zeros_like(time)
+    @staticmethod
+    def evaluate_signals(signals, t):
+        """Evaluate the sum of the given signal components at arbitrary instants."""
+        combined_amplitude = np.zeros(len(t))
+        for signal in signals:
+            combined_amplitude += signal.evaluate(t)
+        return combined_amplitude
+
+    def set_combined(self, combined_amplitude):
+        """Store a new running sum and its mean power."""
+        signal_power = float(np.mean(combined_amplitude ** 2))
+        self.combined = (self.time, self.buffers.put("combined", combined_amplitude), signal_power)
+
+    def append_signal(self, signal):
+        """Add a component and fold it into the running sum in O(length)."""
+        with self.timer.measure("combine"):
+            if self.combined is None:
+                if isinstance(signal.time, UniformTimeBase):
+                    self.time = signal.time
+                else:
+                    # Only a non-uniform time base is stored as an array
+                    self.time = self.buffers.put("time", signal.time)
+                    signal.time = self.time
+                self.set_combined(signal.evaluate(self.time))
+            else:
+                self.set_combined(self.combined[1] + signal.evaluate(self.time))
+        self.signals.append(signal)
 
-        for signal in self.signals:
-            combined_amplitude += signal.amplitude
-        original_signal = combined_amplitude
+    def export_signal(self, parent):
+        """Save the combined signal and its component metadata to a binary signal file."""
+        if self.combined is None:
+            QMessageBox.warning(parent, "No Signal", "No signals to export.")
+            return
 
-        # Signal power calculation
-        signal_power = np.mean(combined_amplitude ** 2)
+        file_path, _ = QFileDialog.getSaveFileName(parent, "Export Signal", "", "Signal Files (*.sig)")
+        if not file_path:
+            return
+        if not file_path.lower().endswith(signal_io.BINARY_EXTENSION):
+            file_path += signal_io.BINARY_EXTENSION
 
-        # Noise power calculation with SNR in decibels (dB)
-        noise_power = signal_power / (10 ** (self.snr / 10))
-        noise = np.sqrt(noise_power) * np.random.normal(0, 1, len(combined_amplitude))
+        components = []
+        for signal in self.signals:
+            components.extend(signal.components or [
+                {"name": signal.name, "frequency": signal.frequency, "amplitude": signal.amplitude_value}
+            ])
+        time, combined_amplitude, _ = self.combined
+        try:
+            signal_io.save_binary_signal(file_path, combined_amplitude, time, components=components)
+        except Exception as e:
+            QMessageBox.critical(parent, "Error", f"Failed to export signal to '{file_path}':\n{e}")
 
-        # Combine signal with noise
-        noisy_signal = combined_amplitude + noise
+    def regenerate_noise(self):
+        """Draw a new noise realization."""
+        return self.noise.regenerate()
 
+    def aliasing_report(self, sampling_frequency):
+        """
+        Nyquist check of the components with a known frequency
 
+        Uploaded signal files contribute every component listed in their metadata;
+        uploads without numeric frequency metadata are left out.
+        """
+        frequencies = []
+        names = []
+        for signal in self.signals:
+            if signal.components:
+                for component in signal.components:
+                    if isinstance(component.get("frequency"), numbers.Real):
+                        frequencies.append(component["frequency"])
+                        names.append(component.get("name") or signal.name)
+            elif isinstance(signal.frequency, numbers.Real):
+                frequencies.append(signal.frequency)
+                names.append(signal.name)
+        return aliasing.aliasing_report(frequencies, sampling_frequency, names=names)
 
-        return time, noisy_signal , original_signal
     def remove_signal(self, signal_id):
         """Remove a signal by its ID."""
+        removed = [signal for signal in self.signals if signal.signal_id == signal_id]
         self.signals = [signal for signal in self.signals if signal.signal_id != signal_id]
 
+        for signal in removed:
+            self.buffers.discard(f"signal-{signal.signal_id}")
+
+        if not self.signals:
+            # Start again from an exact zero instead of accumulating rounding residue
+            self.time = None
+            self.combined = None
+            self.buffers.discard("time")
+            self.buffers.discard("combined")
+        elif removed:
+            with self.timer.measure("combine"):
+                combined_amplitude = self.combined[1]
+                for signal in removed:
+                    combined_amplitude = combined_amplitude - signal.evaluate(self.time)
+                self.set_combined(combined_amplitude)
+
+
+class SweepWindow(QWidget):
+    """
+    Error of every reconstruction method over a range of sampling frequencies and SNRs
+
+    The sweep runs on a process pool behind a RecomputeScheduler, so the main window
+    stays responsive; the results are plotted as error-vs-fs curves and can be
+    exported as a CSV table.
+    """
+    METRICS = {"RMSE": "rmse", "Max Error": "max_error", "Reconstruction SNR (dB)": "reconstruction_snr"}
+
+    def __init__(self, signal_manager):
+        super().__init__()
+        self.setWindowTitle('Sampling Frequency Sweep')
+        self.resize(900, 600)
+        self.signal_manager = signal_manager
+        self.table = None
+        self.sweep_start = None
+
+        self.scheduler = RecomputeScheduler(sweep.run_sweep, delay_ms=0, parent=self)
+        self.scheduler.result_ready.connect(self.show_results)
+        self.scheduler.error.connect(self.on_error)
+
+        layout = QVBoxLayout()
+        form_layout = QFormLayout()
+        self.fs_min_input = QLineEdit("2")
+        self.fs_max_input = QLineEdit("100")
+        self.fs_step_input = QLineEdit("1")
+        self.snr_input = QLineEdit("10, 20, 40, 100")
+        form_layout.addRow("Min fs (Hz)", self.fs_min_input)
+        form_layout.addRow("Max fs (Hz)", self.fs_max_input)
+        form_layout.addRow("Step (Hz)", self.fs_step_input)
+        form_layout.addRow("SNRs (dB)", self.snr_input)
+
+        self.metric_dropdown = QComboBox()
+        self.metric_dropdown.addItems(list(self.METRICS))
+        self.metric_dropdown.currentIndexChanged.connect(self.plot_results)
+        form_layout.addRow("Metric", self.metric_dropdown)
+        self.snr_dropdown = QComboBox()
+        self.snr_dropdown.currentIndexChanged.connect(self.plot_results)
+        form_layout.addRow("Plotted SNR", self.snr_dropdown)
+        layout.addLayout(form_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.run_button = QPushButton("Run Sweep")
+        self.run_button.clicked.connect(self.run)
+        self.export_button = QPushButton("Export CSV")
+        self.export_button.clicked.connect(self.export)
+        self.export_button.setEnabled(False)
+        buttons_layout.addWidget(self.run_button)
+        buttons_layout.addWidget(self.export_button)
+        layout.addLayout(buttons_layout)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setLabel('bottom', 'Sampling Frequency (Hz)')
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.4)
+        self.plot_widget.addLegend()
+        layout.addWidget(self.plot_widget)
+        self.setLayout(layout)
+
+    def run(self):
+        """Start a sweep over the entered grid using the current combined signal."""
+        combined = self.signal_manager.combined
+        if combined is None:
+            QMessageBox.warning(self, "No Signal", "No signals to sweep.")
+            return
+        try:
+            fs_min = float(self.fs_min_input.text())
+            fs_max = float(self.fs_max_input.text())
+            fs_step = float(self.fs_step_input.text())
+            if not (fs_step > 0 and fs_max >= fs_min):
+                raise ValueError("The step must be positive and the maximum at least the minimum.")
+            sampling_frequencies = np.arange(fs_min, fs_max + 1e-9, fs_step)
+            snrs = [float(value) for value in self.snr_input.text().split(",") if value.strip()]
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Input", "Please enter valid numbers for the sweep range and SNRs.")
+            return
+
+        time_base, clean = combined[:2]
+        unit_noise = self.signal_manager.noise.unit_noise(len(time_base))
+        self.run_button.setEnabled(False)
+        self.status_label.setText(f"Running {len(sampling_frequencies) * len(snrs)} points per method...")
+        self.sweep_start = time.perf_counter()
+        self.scheduler.request(time_base, clean, sampling_frequencies, snrs, unit_noise=unit_noise,
+                               buffers=self.signal_manager.buffers)
+
+    def show_results(self, table):
+        self.table = table
+        self.run_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+        self.status_label.setText(f"{len(table)} points in {time.perf_counter() - self.sweep_start:.2f} s")
+        self.snr_dropdown.blockSignals(True)
+        self.snr_dropdown.clear()
+        self.snr_dropdown.addItems([f"{snr:g}" for snr in sorted(table["snr"].unique())])
+        self.snr_dropdown.blockSignals(False)
+        self.plot_results()
+
+    def on_error(self, error):
+        self.run_button.setEnabled(True)
+        self.status_label.setText(f"Sweep failed: {error}")
+        logger.error("Sweep error: %s", error)
+
+    def plot_results(self):
+        """Draw one error-vs-fs curve per method for the selected metric and SNR."""
+        self.plot_widget.clear()
+        if self.table is None or not self.snr_dropdown.count():
+            return
+        metric = self.METRICS[self.metric_dropdown.currentText()]
+        self.plot_widget.setLabel('left', self.metric_dropdown.currentText())
+        rows = self.table[self.table["snr"] == float(self.snr_dropdown.currentText())]
+        groups = list(rows.groupby("method", sort=False))
+        for index, (method, method_rows) in enumerate(groups):
+            self.plot_widget.plot(method_rows["sampling_frequency"].to_numpy(), method_rows[metric].to_numpy(),
+                                  pen=pg.mkPen(pg.intColor(index, hues=len(groups)), width=2), name=method)
+
+    def export(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Sweep", "", "CSV Files (*.csv)")
+        if file_path:
+            self.table.to_csv(file_path, index=False)
+
+    def closeEvent(self, event):
+        self.scheduler.wait_for_done()
+        super().closeEvent(event)
+
 
 class GUI(QWidget):
     def __init__(self):
@@ -148,7 +409,13 @@ class GUI(QWidget):
         self.setMinimumSize(1200, 700)  # Set minimum size to prevent extreme resizing
 
         # Initialize SignalManager with plot_signals as the callback
-        self.signal_manager = SignalManager(self.plot_signals)
+        seed = os.environ.get("SIGNAL_STUDIO_SEED")
+        # Stage timings are only recorded while the performance readout is on
+        self.stage_timer = StageTimer(enabled=os.environ.get("SIGNAL_STUDIO_INSTRUMENT") == "1")
+        self.profile_capture = ProfileCapture()
+        self.signal_manager = SignalManager(self.plot_signals, seed=int(seed) if seed else None,
+                                            timer=self.stage_timer)
+        self.sweep_window = None
 
         # Create a horizontal layout and set it as the main layout
         horizontal_layout = QHBoxLayout()
@@ -157,9 +424,30 @@ class GUI(QWidget):
         self.data = []
         self.time = []
         self.amplitude = []
+        self.samples = []
         self.sampled_amplitude = []
         self.sampling_frequency = 2
         self.original_signal= []
+        self.interpolant_cache = InterpolantCache()
+
+        # Every derived product is computed once per input change, on a worker thread
+        self.pipeline = pipeline.SignalPipeline(self.signal_manager.noise.add_noise,
+                                                evaluate=SignalManager.evaluate_signals,
+                                                cache=self.interpolant_cache,
+                                                buffers=self.signal_manager.buffers,
+                                                timer=self.stage_timer)
+        self.recompute_scheduler = RecomputeScheduler(
+            lambda *args, **kwargs: self.profile_capture.call(self.pipeline.evaluate, *args, **kwargs), parent=self)
+        self.request_time = None
+        self.recompute_scheduler.result_ready.connect(self.apply_recompute_result)
+        self.recompute_scheduler.error.connect(self.on_recompute_error)
+
+        # Compare-all mode: every method reconstructed concurrently in worker processes
+        self.method_comparison = MethodComparison(buffers=self.signal_manager.buffers)
+        self.compare_scheduler = RecomputeScheduler(self.method_comparison.compare, parent=self)
+        self.compare_scheduler.result_ready.connect(self.apply_comparison_result)
+        self.compare_scheduler.error.connect(self.on_recompute_error)
+        self.compare_curves = {}
 
         # Create the GraphicsLayoutWidget and set minimum size
         self.window = pg.GraphicsLayoutWidget(show=True, title="Signal Studio")
@@ -209,6 +497,43 @@ class GUI(QWidget):
 
         horizontal_layout.addWidget(self.window)
 
+        # Plot items are created once and only updated with setData afterwards
+        self.noisy_plot = self.signal_viewer.plot(pen='r')
+        self.original_plot = self.signal_viewer.plot(pen=pg.mkPen('b', width=3))
+        self.samples_plot = self.signal_viewer.plot(pen=None, symbol='o', symbolBrush='r', symbolSize=7)
+        self.reconstruction_plot = self.reconstruction_viewer.plot(pen=pg.mkPen('b', width=3))
+        self.difference_plot = self.difference_viewer.plot(pen=pg.mkPen('r', width=3), name='Original Signal')
+        self.bandwidth_plot = self.freq_viewer.plot(pen='r', connect='pairs')
+        self.impulse_plot = self.freq_viewer.plot(pen='b', connect='pairs')
+        # Magnitude spectrum and its images around multiples of fs, all drawn from one cached pyramid
+        self.spectrum_plot = self.freq_viewer.plot(pen=pg.mkPen('b', width=2))
+        self.spectrum_replicas = {k: self.freq_viewer.plot(pen=pg.mkPen((255, 80, 80, 160)))
+                                  for k in SPECTRUM_REPLICAS}
+        for curve in (self.spectrum_plot, *self.spectrum_replicas.values()):
+            curve.setVisible(False)
+        self.frame_stamps = deque(maxlen=60)
+
+        # Level-of-detail curves, redrawn from their min/max pyramid when a view is panned, zoomed or resized
+        self.lod_curves = {
+            self.signal_viewer: [self.noisy_plot, self.original_plot],
+            self.reconstruction_viewer: [self.reconstruction_plot],
+            self.difference_viewer: [self.difference_plot],
+            self.freq_viewer: [self.spectrum_plot, *self.spectrum_replicas.values()],
+        }
+        for curves in self.lod_curves.values():
+            for curve in curves:
+                curve.lod_pyramid = None
+                curve.lod_offset = 0.0
+        self.lod_refreshing = False
+        for viewer in self.lod_curves:
+            viewer.sigXRangeChanged.connect(lambda _, __, viewer=viewer: self.refresh_lod(viewer))
+            viewer.getViewBox().sigResized.connect(lambda _, viewer=viewer: self.refresh_lod(viewer))
+
+        # Time range the reconstruction is evaluated on, None for the whole signal
+        self.output_window = None
+        for viewer in (self.reconstruction_viewer, self.difference_viewer):
+            viewer.sigXRangeChanged.connect(lambda *_: self.update_output_window())
+
         # Create a vertical layout for the toolbar
         # Create a vertical layout for the toolbar
         # Initialize the main layout for the toolbar
@@ -230,10 +555,20 @@ class GUI(QWidget):
             border-radius: 5px;
         """)
         upload_layout.addWidget(upload_button)
+        export_button = QPushButton("Export")
+        export_button.setStyleSheet("""
+            font-size: 14px; 
+            padding: 10px;
+            background-color: #2196F3; 
+            color: white; 
+            border-radius: 5px;
+        """)
+        upload_layout.addWidget(export_button)
         upload_box.setLayout(upload_layout)
         upload_box.setContentsMargins(1,1,1,1)
         toolbar_layout.addWidget(upload_box)
         upload_button.clicked.connect(lambda: self.signal_manager.upload_signal(self))
+        export_button.clicked.connect(lambda: self.signal_manager.export_signal(self))
 
         #toolbar_layout.addStretch(1)
 
@@ -316,15 +651,27 @@ class GUI(QWidget):
         self.frequency_slider.valueChanged.connect(self.update_stem_plot)
         self.frequency_slider.setRange(2,100)
 
+        self.aliasing_label = QLabel()
+        self.aliasing_label.setWordWrap(True)
+        self.aliasing_label.setStyleSheet("font-size: 13px; color: #333333; font-weight: normal;")
+        controls_layout.addWidget(self.aliasing_label)
+
         self.SNR_slider, SNR_slider_layout = create_slider("SNR", 100)
         controls_layout.addLayout(SNR_slider_layout)
         self.SNR_slider.valueChanged.connect(lambda: self.update_plot_with_noise())
 
+        regenerate_noise_button = QPushButton("Regenerate Noise")
+        regenerate_noise_button.setStyleSheet(
+            "font-size: 14px; padding: 10px; background-color: #2196F3; color: white; border-radius: 5px;")
+        regenerate_noise_button.clicked.connect(self.regenerate_noise)
+        controls_layout.addWidget(regenerate_noise_button)
+
         dropdown_layout = QFormLayout()
         dropdown_layout.setHorizontalSpacing(10)
 
         self.type_dropdown = QComboBox()
-        self.type_dropdown.addItems(["Linear", "Quadratic", "Sinc", "Zero Order Hold", "Nearest Neighbor", "lanczos", "cubic"])  # Add options to the combobox
+        # Filled from the registry so the names always match what reconstruct() accepts
+        self.type_dropdown.addItems(reconstruction.available_methods())
         self.type_dropdown.setStyleSheet("padding: 5px; height: 30px;")
         self.type_dropdown.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.type_dropdown.currentIndexChanged.connect(self.update_reconstruction)
@@ -334,8 +681,56 @@ class GUI(QWidget):
 
         dropdown_layout.addRow(reconstruction_label, self.type_dropdown)
 
+        self.frequency_view_dropdown = QComboBox()
+        self.frequency_view_dropdown.addItems(list(FREQUENCY_VIEWS))
+        self.frequency_view_dropdown.setStyleSheet("padding: 5px; height: 30px;")
+        self.frequency_view_dropdown.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.frequency_view_dropdown.currentIndexChanged.connect(self.update_frequency_view)
+        frequency_view_label = QLabel("Frequency View")
+        frequency_view_label.setFixedHeight(20)
+        frequency_view_label.setStyleSheet("font-size: 14px; color: #333333;")
+        dropdown_layout.addRow(frequency_view_label, self.frequency_view_dropdown)
+
+        self.window_dropdown = QComboBox()
+        self.window_dropdown.addItems(list(SPECTRUM_WINDOWS))
+        self.window_dropdown.setStyleSheet("padding: 5px; height: 30px;")
+        self.window_dropdown.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.window_dropdown.currentIndexChanged.connect(self.update_frequency_view)
+        self.window_dropdown.setEnabled(False)
+        window_label = QLabel("Window")
+        window_label.setFixedHeight(20)
+        window_label.setStyleSheet("font-size: 14px; color: #333333;")
+        dropdown_layout.addRow(window_label, self.window_dropdown)
+
         controls_layout.addLayout(dropdown_layout)
 
+        self.reconstruction_label = QLabel()
+        self.reconstruction_label.setWordWrap(True)
+        self.reconstruction_label.setStyleSheet("font-size: 13px; color: #D32F2F; font-weight: normal;")
+        controls_layout.addWidget(self.reconstruction_label)
+
+        self.compare_checkbox = QCheckBox("Compare all methods")
+        self.compare_checkbox.setStyleSheet("font-size: 14px; color: #333333;")
+        self.compare_checkbox.toggled.connect(self.toggle_compare_mode)
+        controls_layout.addWidget(self.compare_checkbox)
+        self.compare_label = QLabel()
+        self.compare_label.setStyleSheet("font-size: 13px; color: #333333; font-weight: normal;")
+        controls_layout.addWidget(self.compare_label)
+
+        self.performance_checkbox = QCheckBox("Show performance")
+        self.performance_checkbox.setStyleSheet("font-size: 14px; color: #333333;")
+        self.performance_checkbox.setChecked(self.stage_timer.enabled)
+        self.performance_checkbox.toggled.connect(self.toggle_performance)
+        controls_layout.addWidget(self.performance_checkbox)
+        self.profile_checkbox = QCheckBox("Profile (cProfile + tracemalloc)")
+        self.profile_checkbox.setStyleSheet("font-size: 14px; color: #333333;")
+        self.profile_checkbox.toggled.connect(self.toggle_profiling)
+        controls_layout.addWidget(self.profile_checkbox)
+        self.performance_label = QLabel()
+        self.performance_label.setStyleSheet("font-size: 12px; color: #333333; font-weight: normal;")
+        self.performance_label.setVisible(self.stage_timer.enabled)
+        controls_layout.addWidget(self.performance_label)
+
         # Additional controls
         adding_signal_box = QGroupBox("Adding Signal")
         adding_signal_box.setStyleSheet("""
@@ -413,8 +808,14 @@ class GUI(QWidget):
         # Form layout for labels and input fields
         clear_button.clicked.connect(self.delete_selected_signal)
 
+        sweep_button = QPushButton("Sampling Sweep")
+        sweep_button.setStyleSheet(
+            "font-size: 14px; padding: 10px; background-color: #2196F3; color: white; border-radius: 5px;")
+        sweep_button.clicked.connect(self.open_sweep_window)
+
         controls_layout.addWidget(add_signal_button)
         controls_layout.addWidget(clear_button)
+        controls_layout.addWidget(sweep_button)
 
         controls_box.setLayout(controls_layout)
         toolbar_layout.addWidget(controls_box)
@@ -435,8 +836,16 @@ class GUI(QWidget):
         horizontal_layout.addWidget(toolbar_scroll_area, stretch=1)
         self.setLayout(horizontal_layout)
 
+        # The default signal is only added once the window is shown (see showEvent),
+        # so its pipeline run does not delay the first frame
+        self.default_signal_pending = True
 
-        self.generate_and_add_default_signal()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.default_signal_pending:
+            self.default_signal_pending = False
+            # A zero timer fires after the paint events queued by the first show
+            QTimer.singleShot(0, self.generate_and_add_default_signal)
 
 
     def generate_and_add_default_signal(self):
@@ -452,45 +861,9 @@ class GUI(QWidget):
 
 
 
-    def check_data_validity(self, samples, sampled_amplitude):
-        try:
-
-            samples = np.array(samples)
-            sampled_amplitude = np.array(sampled_amplitude)
-            print(f"Checking Data - Samples: {samples}, Sampled Amplitude: {sampled_amplitude}")
-
-            if len(samples) < 2 or len(sampled_amplitude) < 2:
-                print("Error: Not enough data points for interpolation.")
-                return False
-
-            if np.any(np.isnan(samples)) or np.any(np.isnan(sampled_amplitude)):
-                print("Error: Data contains NaN values.")
-                return False
-
-            return True
-        except Exception as e:
-            print(f"Error during data validity check: {e}")
-            return False
-
-
-
     def update_reconstruction(self):
-        print("Updating reconstruction...")
-
-
-        self.samples = np.array(self.samples)
-        self.sampled_amplitude = np.array(self.sampled_amplitude)
-
-        print(f"Before Reconstruction - Samples: {self.samples}, Sampled Amplitude: {self.sampled_amplitude}")
-
-
-        if self.check_data_validity(self.samples, self.sampled_amplitude):
-
-            self.reconstruct(self.samples, self.sampled_amplitude)
-        else:
-            print("Data is not valid for reconstruction.")
-
-        print(f"After Reconstruction - Samples: {self.samples}, Sampled Amplitude: {self.sampled_amplitude}")
+        logger.debug("Updating reconstruction...")
+        self.schedule_recompute()
 
     def add_signal_to_table( self,name, frequency, amplitude):
         """Insert a new row in the signal info table with the provided signal name, frequency, and amplitude."""
@@ -498,8 +871,9 @@ class GUI(QWidget):
         self.signal_info_table.insertRow(row_position)
 
         self.signal_info_table.setItem(row_position, 0, QTableWidgetItem(name))
-        self.signal_info_table.setItem(row_position, 1, QTableWidgetItem(f"{frequency} Hz"))
-        self.signal_info_table.setItem(row_position, 2, QTableWidgetItem(str(amplitude)))
+        # Uploaded files may not carry frequency/amplitude metadata
+        self.signal_info_table.setItem(row_position, 1, QTableWidgetItem("-" if frequency is None else f"{frequency} Hz"))
+        self.signal_info_table.setItem(row_position, 2, QTableWidgetItem("-" if amplitude is None else str(amplitude)))
     def delete_selected_signal(self):
         """Delete the selected signal from the table and SignalManager."""
         selected_row = self.signal_info_table.currentRow()
@@ -526,432 +900,381 @@ class GUI(QWidget):
             QMessageBox.warning(self, "Error", "Signal not found.")
     def Clear(self):
         if not self.signal_manager.signals:
-            self.signal_viewer.clear()
-            self.reconstruction_viewer.clear()
-            self.difference_viewer.clear()
-            self.freq_viewer.clear()
-            self.original_plot = None
-            self.noisy_plot = None
+            self.recompute_scheduler.cancel()
+            self.compare_scheduler.cancel()
+            self.compare_label.setText("")
+            self.reconstruction_label.setText("")
+            for _, curve in self.compare_curves.values():
+                curve.setData([], [])
+                curve.lod_pyramid = None
+            for curve in (self.noisy_plot, self.original_plot, self.samples_plot, self.reconstruction_plot,
+                          self.difference_plot, self.bandwidth_plot, self.impulse_plot, self.spectrum_plot,
+                          *self.spectrum_replicas.values()):
+                curve.setData([], [])
+                curve.lod_pyramid = None
             self.original_signal=None
+            self.amplitude = []
+            self.samples = []
+            self.sampled_amplitude = []
+            # Let a running job finish before its shared samples are freed
+            self.recompute_scheduler.wait_for_done()
+            self.pipeline.release_buffers()
+            self.update_aliasing_label()
 
     def plot_signals(self):
         if not self.signal_manager.signals:
             QMessageBox.warning(self, "No Signal", "No signals to plot.")
             return
+        self.schedule_recompute()
 
-        time, noisy_signal,self.original_signal = self.signal_manager.get_combined_signal_with_noise()
-        if time is None or noisy_signal is None:
-            return
-
-        if not hasattr(self, 'noisy_plot') or self.noisy_plot is None:
-            self.noisy_plot = self.signal_viewer.plot(time, noisy_signal, pen='r')
-        else:
-            self.noisy_plot.setData(time, noisy_signal)
-        self.start(noisy_signal, time)
+    def regenerate_noise(self):
+        """Switch to a new noise realization and redraw."""
+        self.signal_manager.regenerate_noise()
+        self.plot_signals()
 
     def update_plot_with_noise(self):
         """Update the plot when SNR slider value changes."""
         self.signal_manager.set_snr(self.SNR_slider.value())
         self.plot_signals()
 
-    def start(self,amplitude,time):
-        self.time = time
-        self.amplitude = amplitude
-        self.take_samples(self.time, self.amplitude, self.sampling_frequency)
-        self.stem_plot(self.samples, self.sampled_amplitude)
-        self.plot(self.time, self.amplitude)
-        self.reconstruct(self.samples, self.sampled_amplitude)
-        self.plot_frequency(self.original_signal, self.time)
+    def update_output_window(self):
+        """
+        Follow the visible range of the zoomed reconstruction and difference viewers
 
-    def plot(self, time, amplitude):
-        # Plot the original signal if not already plotted
-        if not hasattr(self, 'original_plot') or self.original_plot is None:
-            self.original_plot = self.signal_viewer.plot(time, amplitude,
-                                                         pen=pg.mkPen('b', width=3))  # Set line color and width
+        The reconstruction is evaluated on the original time instants, so zooming in
+        never needs more points; it is only recomputed when the view leaves the
+        evaluated range. That range extends one view width past each side, so
+        panning does not recompute at every step.
+        """
+        view_boxes = [viewer.getViewBox() for viewer in (self.reconstruction_viewer, self.difference_viewer)]
+        # Auto-ranged viewers follow whatever is evaluated, only zoomed ones constrain it
+        ranges = [view_box.viewRange()[0] for view_box in view_boxes if not view_box.state['autoRange'][0]]
+        if not ranges:
+            window = None
+        else:
+            start = min(x_min for x_min, _ in ranges)
+            end = max(x_max for _, x_max in ranges)
+            if self.output_window is not None and self.output_window[0] <= start and end <= self.output_window[1]:
+                return
+            width = end - start
+            window = (start - width, end + width)
+
+        if window != self.output_window:
+            self.output_window = window
+            self.schedule_recompute()
+
+    def spectrum_settings(self):
+        """(window, Welch segment length) of the selected frequency view, or None for the bandwidth view."""
+        view = self.frequency_view_dropdown.currentText()
+        if view == "Bandwidth":
+            return None
+        return self.window_dropdown.currentText(), FREQUENCY_VIEWS[view]
+
+    def update_frequency_view(self):
+        """Switch between the bandwidth markers and the magnitude spectrum."""
+        spectrum_view = self.spectrum_settings() is not None
+        self.window_dropdown.setEnabled(spectrum_view)
+        self.bandwidth_plot.setVisible(not spectrum_view)
+        self.impulse_plot.setVisible(not spectrum_view)
+        for curve in self.lod_curves[self.freq_viewer]:
+            curve.setVisible(spectrum_view)
+        self.schedule_recompute()
+
+    def schedule_recompute(self):
+        """Queue the update graph on the worker thread with the current inputs."""
+        self.update_aliasing_label()
+        if not self.signal_manager.signals:
+            return
+        self.request_time = time.perf_counter()
+        self.recompute_scheduler.request(tuple(self.signal_manager.signals), self.signal_manager.combined,
+                                         self.signal_manager.snr, self.sampling_frequency,
+                                         self.type_dropdown.currentText(), self.signal_manager.noise.key,
+                                         self.spectrum_settings(), output_window=self.output_window)
+
+    def update_aliasing_label(self):
+        """Show the Nyquist rate and the folded frequency of every aliased component."""
+        report = self.signal_manager.aliasing_report(self.sampling_frequency)
+        if not report["components"]:
+            self.aliasing_label.setText("")
+            return
+        text = f"Nyquist rate: {report['nyquist_rate']:g} Hz"
+        if report["aliased"]:
+            folded = [f"{c['frequency']:g} Hz \u2192 {c['alias']:g} Hz" for c in report["components"] if c["aliased"]]
+            self.aliasing_label.setText(f"{text}<br><span style='color: #D32F2F;'>Aliasing: "
+                                        f"{', '.join(folded)}</span>")
+        else:
+            self.aliasing_label.setText(f"{text}<br><span style='color: #388E3C;'>No aliasing</span>")
+
+    def toggle_performance(self, enabled):
+        """Start or stop recording stage timings and show them under the controls."""
+        self.stage_timer.enabled = enabled
+        self.performance_label.setVisible(enabled)
+        self.performance_label.setText("")
+        self.frame_stamps.clear()
+
+    def toggle_profiling(self, enabled):
+        """Profile the recompute jobs while checked, and write the report when unchecked."""
+        if enabled:
+            self.profile_capture.start()
         else:
-            self.original_plot.setData(time, amplitude)  # Update data if plot already exists
-        self.plot_frequency(self.original_signal,self.time)
+            path = self.profile_capture.stop()
+            if path is not None:
+                logger.warning("Profile written to %s", path)
+
+    def update_performance_label(self):
+        """Show the request-to-frame latency, the frame rate and the last time of every stage."""
+        lines = []
+        latency = self.stage_timer.last("latency")
+        if latency is not None:
+            lines.append(f"Latency: {latency * 1e3:.1f} ms")
+        if len(self.frame_stamps) > 1:
+            span = self.frame_stamps[-1] - self.frame_stamps[0]
+            if span > 0:
+                lines.append(f"Frame rate: {(len(self.frame_stamps) - 1) / span:.1f} fps")
+        stages = ", ".join(f"{stage} {last * 1e3:.1f}" for stage, (last, _, _) in self.stage_timer.summary().items()
+                           if stage != "latency")
+        if stages:
+            lines.append(f"Stages (ms): {stages}")
+        self.performance_label.setText("<br>".join(lines))
+
+    def apply_recompute_result(self, result):
+        """Redraw the products that changed in a finished recompute."""
+        frame_start = time.perf_counter()
+        changed = result["changed"]
+        logger.debug("Pipeline stage runs: %s", result["stage_runs"])
+
+        self.time = result["time"]
+        self.original_signal = result["original_signal"]
+        self.amplitude = result["noisy_signal"]
+        if "noisy" in changed:
+            self.set_lod_data(self.signal_viewer, self.noisy_plot, self.time, self.amplitude)
+            self.plot(self.time, self.amplitude)
+
+        self.samples = result["samples"]
+        self.sampled_amplitude = result["sampled_amplitude"]
+        if "samples" in changed:
+            self.stem_plot(self.samples, self.sampled_amplitude)
+        if "reconstruction" in changed or "difference" in changed:
+            self.reconstruct(result["reconstructed_time"], result["reconstructed_amplitude"], result["difference"],
+                             result["reconstruction_error"])
+        if self.compare_checkbox.isChecked() and "samples" in changed:
+            self.schedule_comparison()
+        if result["spectrum"] is None:
+            # The spectrum stage reruns (returning None) when switching back from a spectrum view
+            if changed & {"bandwidth", "samples", "spectrum"}:
+                self.plot_frequency(result["bandwidth"], result["sampling_frequency"])
+        elif "spectrum" in changed or "samples" in changed:
+            self.plot_spectrum(result["spectrum"], result["sampling_frequency"], "spectrum" in changed)
+
+        frame_end = time.perf_counter()
+        self.stage_timer.record("render", frame_end - frame_start)
+        if self.request_time is not None:
+            self.stage_timer.record("latency", frame_end - self.request_time)
+        self.frame_stamps.append(frame_end)
+        logger.debug("Frame time: %.2f ms", (frame_end - frame_start) * 1e3)
+        if self.stage_timer.enabled:
+            self.update_performance_label()
+
+    def toggle_compare_mode(self, enabled):
+        """Show every method at once, or go back to the method selected in the dropdown."""
+        self.type_dropdown.setEnabled(not enabled)
+        self.reconstruction_plot.setVisible(not enabled)
+        self.difference_plot.setVisible(not enabled)
+        if enabled:
+            self.schedule_comparison()
+            return
 
+        self.compare_scheduler.cancel()
+        self.compare_label.setText("")
+        for viewer, curve in self.compare_curves.values():
+            viewer.removeItem(curve)
+            self.lod_curves[viewer].remove(curve)
+        self.compare_curves.clear()
 
+    def schedule_comparison(self):
+        """Queue a reconstruction of the current samples with every method."""
+        if self.original_signal is None or len(self.samples) < 2:
+            return
+        self.compare_scheduler.request(self.samples, self.sampled_amplitude, self.time, self.original_signal)
+
+    def compare_curve(self, viewer, method, index):
+        """Return the overlay curve of a method in a viewer, creating it on first use."""
+        key = (viewer, method)
+        if key not in self.compare_curves:
+            curve = viewer.plot(pen=pg.mkPen(pg.intColor(index, hues=len(self.method_comparison.methods)), width=2),
+                                name=method)
+            curve.lod_pyramid = None
+            curve.lod_offset = 0.0
+            self.lod_curves[viewer].append(curve)
+            self.compare_curves[key] = (viewer, curve)
+        return self.compare_curves[key][1]
+
+    def apply_comparison_result(self, comparison):
+        """Overlay the reconstructions of every method and list their errors."""
+        if not self.compare_checkbox.isChecked():
+            return
+        out_t = comparison["out_t"]
+        for index, method in enumerate(self.method_comparison.methods):
+            if method not in comparison["reconstructions"]:
+                continue
+            curve = self.compare_curve(self.reconstruction_viewer, method, index)
+            curve.lod_pyramid = MinMaxPyramid(out_t, comparison["reconstructions"][method])
+            curve = self.compare_curve(self.difference_viewer, method, index)
+            curve.lod_pyramid = MinMaxPyramid(out_t, comparison["differences"][method])
+        self.refresh_lod(self.reconstruction_viewer)
+        self.refresh_lod(self.difference_viewer)
+
+        lines = [f"{method}: RMSE {rmse:.4f}, max {max_error:.4f}"
+                 for method, (rmse, max_error) in sorted(comparison["metrics"].items(), key=lambda item: item[1])]
+        lines += [f"{method}: {message}" for method, message in comparison["errors"].items()]
+        self.compare_label.setText("<br>".join(lines))
+
+    def on_recompute_error(self, error):
+        logger.error("Reconstruction error: %s", error)
 
-    def stem_plot(self, time, amplitude):
-        # Clear previous sampled plots, including vertical lines and dots
-        if hasattr(self, 'sampled_items'):
-            for item in self.sampled_items:
-                self.signal_viewer.removeItem(item)
+    def plot(self, time, amplitude):
+        self.set_lod_data(self.signal_viewer, self.original_plot, time, amplitude)
 
-        # Create a list to store the new sampled plot items (vertical lines and dots)
-        self.sampled_items = []
 
 
-        # Plot and store dots as a single item with reduced size
-        dots = self.signal_viewer.plot(time, amplitude, pen=None, symbol='o', symbolBrush='r',
-                                       symbolSize=7)  # Adjust size as needed
-        self.sampled_items.append(dots)
+    def set_lod_data(self, viewer, curve, x, y):
+        """Build a min/max pyramid for a curve and draw the part visible in its viewer."""
+        curve.lod_pyramid = MinMaxPyramid(x, y)
+        self.refresh_lod(viewer)
+
+    def refresh_lod(self, viewer):
+        """Redraw the level-of-detail curves of a viewer for its current range and width."""
+        if self.lod_refreshing:
+            return
+        view_box = viewer.getViewBox()
+        (x_min, x_max), _ = view_box.viewRange()
+        pixels = max(int(view_box.width()), 100)
+        if view_box.state['autoRange'][0]:
+            # Let auto-range see the full extent of the data
+            x_min = x_max = None
+
+        self.lod_refreshing = True
+        try:
+            for curve in self.lod_curves[viewer]:
+                if curve.lod_pyramid is None:
+                    continue
+                offset = curve.lod_offset
+                if x_min is None:
+                    x, y = curve.lod_pyramid.query(None, None, pixels)
+                else:
+                    x, y = curve.lod_pyramid.query(x_min - offset, x_max - offset, pixels)
+                curve.setData(x + offset if offset else x, y)
+        finally:
+            self.lod_refreshing = False
+
+    def stem_plot(self, time, amplitude):
+        self.samples_plot.setData(time, amplitude)
 
     def update_stem_plot(self):
         self.sampling_frequency = self.frequency_slider.value()
-        try:
-            self.take_samples(self.time, self.amplitude, self.sampling_frequency)
-            self.stem_plot(self.samples, self.sampled_amplitude)
-            self.reconstruct(self.samples, self.sampled_amplitude)
-        except:
+        if not self.signal_manager.signals:
             msg_box = QMessageBox()
             msg_box.setIcon(QMessageBox.Information)
             msg_box.setText("Upload Signal first")
             msg_box.setWindowTitle("Upload Error !")
             msg_box.setStandardButtons(QMessageBox.Ok)
             msg_box.exec_()
+            return
+        self.schedule_recompute()
 
 
     def calculate_max_frequency(self, amplitude):
         # Use FFT to find the maximum frequency component
         spectrum = np.fft.fft(amplitude)
-        freqs = np.fft.fftfreq(len(amplitude), d=(self.time[1] - self.time[0]))  # Assuming uniform sampling
+        freqs = np.fft.fftfreq(len(amplitude), d=time_step(self.time))  # Assuming uniform sampling
         max_freq = np.abs(freqs[np.argmax(np.abs(spectrum))])
         return max_freq
 
-    def take_samples(self, time, amplitude, sampling_frequency):
-        self.samples = np.arange(time[0], time[len(time) - 1], (1 / sampling_frequency))
-        self.sampled_amplitude = np.interp(self.samples, time, amplitude)
-        self.plot(self.time, self.amplitude)
-
-    def recontruct_by_sinc(self,samples_amplitude,samples_time,original_time):
-        T = original_time[-1]-original_time[0]
-        return np.sum(samples_amplitude[:,None]* np.sinc((samples_time[None,:]-original_time[:,None])/T),axis=0)
-
-    def linear_interpolation(self, x_known, y_known, num_points=1500):
+    def reconstruct(self, reconstructed_time, reconstructed_amplitude, difference, error=None):
         """
-        Perform linear interpolation
+        Draw the reconstructed signal and its difference from the original
 
         Args:
-            x_known (array-like): Known x values
-            y_known (array-like): Known y values
-            num_points (int): Number of interpolation points
-
-        Returns:
-            tuple: Interpolated x and y values
+            reconstructed_time (ndarray): Reconstruction time base
+            reconstructed_amplitude (ndarray): Reconstructed amplitude
+            difference (ndarray): Original minus reconstructed signal
+            error (str): Why the reconstruction could not be computed, shown instead
         """
-        try:
-            # Convert to numpy arrays for robust handling
-            x_known = np.asarray(x_known)
-            y_known = np.asarray(y_known)
-
-            # Validate input
-            if len(x_known) < 2 or len(y_known) < 2:
-                print("Error: Not enough data points for interpolation.")
-                return None, None
-
-            # Create interpolation points
-            x_interp = np.linspace(x_known.min(), x_known.max(), num_points)
-
-            # Perform interpolation
-            linear_interp = interp1d(x_known, y_known, kind='linear', fill_value='extrapolate')
-            y_interp = linear_interp(x_interp)
-
-            return x_interp, y_interp
-
-        except Exception as e:
-            print(f"Linear interpolation error: {e}")
-            return None, None
-
-    def quadratic_interpolation(self, x_known, y_known, num_points=1500):
-        """
-        Perform quadratic interpolation
-
-        Args:
-            x_known (array-like): Known x values
-            y_known (array-like): Known y values
-            num_points (int): Number of interpolation points
-
-        Returns:
-            tuple: Interpolated x and y values
-        """
-        try:
-            # Convert to numpy arrays for robust handling
-            x_known = np.asarray(x_known)
-            y_known = np.asarray(y_known)
-
-            # Validate input
-            if len(x_known) < 3 or len(y_known) < 3:
-                print("Error: Not enough data points for quadratic interpolation.")
-                return None, None
-
-            # Create interpolation points
-            x_interp = np.linspace(x_known.min(), x_known.max(), num_points)
-
-            # Perform interpolation
-            quadratic_interp = interp1d(x_known, y_known, kind='quadratic', fill_value='extrapolate')
-            y_interp = quadratic_interp(x_interp)
-
-            return x_interp, y_interp
-
-        except Exception as e:
-            print(f"Quadratic interpolation error: {e}")
-            return None, None
-
-    def zero_order_hold(self, x_known, y_known, num_points=1500):
-        """
-        Perform zero-order hold reconstruction
-
-        Args:
-            x_known (array-like): Known x values
-            y_known (array-like): Known y values
-            num_points (int): Number of interpolation points
-
-        Returns:
-            tuple: Reconstructed x and y values
-        """
-        try:
-            # Convert to numpy arrays for robust handling
-            x_known = np.asarray(x_known)
-            y_known = np.asarray(y_known)
-
-            # Validate input
-            if len(x_known) < 2 or len(y_known) < 2:
-                print("Error: Not enough data points for zero-order hold.")
-                return None, None
-
-            # Create fine-grained time array
-            x_interp = np.linspace(x_known.min(), x_known.max(), num_points)
-
-            # Perform zero-order hold interpolation
-            y_interp = np.zeros_like(x_interp)
-            for i in range(len(x_known) - 1):
-                mask = (x_interp >= x_known[i]) & (x_interp < x_known[i + 1])
-                y_interp[mask] = y_known[i]
-
-            # Handle the last segment
-            y_interp[x_interp >= x_known[-1]] = y_known[-1]
-
-            return x_interp, y_interp
-
-        except Exception as e:
-            print(f"Zero-order hold error: {e}")
-            return None, None
-
-    def nearest_neighbor_interpolation(self, x_known, y_known, num_points=1500):
-        """
-        Perform nearest neighbor interpolation
-
-        Args:
-            x_known (array-like): Known x values
-            y_known (array-like): Known y values
-            num_points (int): Number of interpolation points
-
-        Returns:
-            tuple: Reconstructed x and y values
-        """
-        try:
-            # Convert to numpy arrays for robust handling
-            x_known = np.asarray(x_known)
-            y_known = np.asarray(y_known)
-
-            # Validate input
-            if len(x_known) < 2 or len(y_known) < 2:
-                print("Error: Not enough data points for nearest neighbor interpolation.")
-                return None, None
-
-            # Create interpolation points
-            x_interp = np.linspace(x_known.min(), x_known.max(), num_points)
-
-            # Perform nearest neighbor interpolation
-            nearest_interp = interp1d(x_known, y_known, kind='nearest', fill_value='extrapolate')
-            y_interp = nearest_interp(x_interp)
-
-            return x_interp, y_interp
-
-        except Exception as e:
-            print(f"Nearest neighbor interpolation error: {e}")
-            return None, None
-
-    def lanczos_interpolation(self, x_known, y_known, num_points=1500, a=3):
-        """
-        Lanczos Interpolation
-
-        Args:
-            x_known (array): Original sample points
-            y_known (array): Original sample values
-            num_points (int): Number of interpolation points
-            a (int): Lanczos interpolation window size
-
-        Returns:
-            tuple: Interpolated time and amplitude arrays
-        """
-        try:
-            x_known = np.asarray(x_known)
-            y_known = np.asarray(y_known)
-
-            # Create interpolation points
-            x_interp = np.linspace(x_known.min(), x_known.max(), num_points)
-
-            # Lanczos interpolation
-            y_interp = scipy.ndimage.map_coordinates(
-                y_known,
-                [np.interp(x_interp, x_known, np.arange(len(x_known)))],
-                order=a,
-                mode='nearest'
-            )[0]
-
-            return x_interp, y_interp
-
-        except Exception as e:
-            print(f"Lanczos interpolation error: {e}")
-            return None, None
-
-    def cubic_interpolation(self, x_known, y_known, num_points=1500):
-        """
-        Perform cubic spline interpolation
-
-        Args:
-            x_known (array-like): Known x (time) values
-            y_known (array-like): Known y (amplitude) values
-            num_points (int): Number of interpolation points
-
-        Returns:
-            tuple: Interpolated time and amplitude arrays
-        """
-        try:
-            # Convert inputs to numpy arrays
-            x_known = np.asarray(x_known)
-            y_known = np.asarray(y_known)
-
-            # Validate input
-            if len(x_known) < 4 or len(y_known) < 4:
-                print("Error: Cubic interpolation requires at least 4 data points.")
-                return None, None
-
-            # Create interpolation points
-            x_interp = np.linspace(x_known.min(), x_known.max(), num_points)
-
-            # Perform cubic spline interpolation
-            cubic_spline = scipy.interpolate.CubicSpline(x_known, y_known)
-            y_interp = cubic_spline(x_interp)
-
-            return x_interp, y_interp
-
-        except Exception as e:
-            print(f"Cubic interpolation error: {e}")
-            return None, None
-
-    def reconstruct(self, samples, sampled_amplitude):
-        """
-        Reconstruct the signal using selected interpolation method
-
-        Args:
-            samples (array-like): Time samples
-            sampled_amplitude (array-like): Amplitude samples
-        """
-        # Clear previous plots
-        self.reconstruction_viewer.clear()
-
-
-        # Get selected reconstruction method
-        method = self.type_dropdown.currentText()
-
-        # Perform reconstruction based on selected method
-        try:
-            if method == "Linear":
-                reconstructed_time, reconstructed_amplitude = self.linear_interpolation(samples, sampled_amplitude)
-            elif method == "Quadratic":
-                reconstructed_time, reconstructed_amplitude = self.quadratic_interpolation(samples, sampled_amplitude)
-            elif method == "Zero Order Hold":
-                reconstructed_time, reconstructed_amplitude = self.zero_order_hold(samples, sampled_amplitude)
-            elif method == "Nearest Neighbor":
-                reconstructed_time, reconstructed_amplitude = self.nearest_neighbor_interpolation(samples,
-                                                                                                  sampled_amplitude)
-            elif method == "Lanczos":
-                reconstructed_time, reconstructed_amplitude = self.lanczos_interpolation(samples, sampled_amplitude)
-            elif method == "cubic":
-                reconstructed_time, reconstructed_amplitude = self.cubic_interpolation(samples, sampled_amplitude)
-
-            else:
-                # Fallback to scipy resample if no specific method selected
-                reconstructed_amplitude, reconstructed_time = scipy.signal.resample(sampled_amplitude, 1500, samples)
-
-            # Plot reconstructed signal
-            if reconstructed_time is not None and reconstructed_amplitude is not None and self.original_signal is not None:
-                print(self.original_signal)
-                self.reconstruction_viewer.plot(reconstructed_time, reconstructed_amplitude, pen=pg.mkPen('b', width=3))
-                print("Reconstruction complete.")
-                self.get_difference_plot(self.original_signal,reconstructed_amplitude)
-
-            # if reconstructed_amplitude is not None:
-            #     self.reconstruction_viewer.plot(reconstructed_time, reconstructed_amplitude, pen='b')
-            #     print("Reconstruction complete.")
-
-            else:
-                print("Reconstruction failed due to invalid data.")
-
-        except Exception as e:
-            print(f"Reconstruction error: {e}")
-
-    def get_difference_plot(self,original_signal,reconstructed_signal):
-        self.difference_viewer.clear()
-        difference_amplitude = np.array(original_signal) - np.array(reconstructed_signal)
-        self.difference_viewer.plot(self.time, difference_amplitude, pen=pg.mkPen('r', width=3),name='Original Signal')
+        self.reconstruction_label.setText(error or "")
+        # Plot reconstructed signal
+        if reconstructed_time is not None and reconstructed_amplitude is not None and self.original_signal is not None:
+            self.set_lod_data(self.reconstruction_viewer, self.reconstruction_plot, reconstructed_time,
+                              reconstructed_amplitude)
+            logger.debug("Reconstruction complete.")
+            if difference is not None:
+                self.get_difference_plot(self.original_signal, difference, reconstructed_time)
+        else:
+            # Clear both viewers so they do not keep showing a previous sampling frequency
+            for curve in (self.reconstruction_plot, self.difference_plot):
+                curve.setData([], [])
+                curve.lod_pyramid = None
+            logger.debug("Reconstruction cleared: %s", error)
+
+    def get_difference_plot(self,original_signal,difference_amplitude, difference_time):
+        self.set_lod_data(self.difference_viewer, self.difference_plot, difference_time, difference_amplitude)
         max_y = np.max(original_signal)
         min_y = np.min(original_signal)
         self.difference_viewer.setYRange(min_y, max_y)
 
-    def plot_frequency(self, original_amplitude, original_time):
-        import numpy as np
-
-        # Step 1: Compute Fourier transform of the original signal
-        N = len(original_amplitude)
-        fourier_transform = np.fft.fft(original_amplitude, n=N)
-        freq = np.fft.fftfreq(N, d=(original_time[1] - original_time[0]))
-        fourier_transform_magnitude = np.abs(fourier_transform)
-
-        # Step 2: Normalize the magnitude
-        fourier_transform_magnitude /= np.max(fourier_transform_magnitude)
-
-        # Step 3: Apply a threshold to filter out insignificant magnitudes
-        threshold = 0.1  # Define a threshold (e.g., 10% of max normalized magnitude)
-        significant_indices = np.where(fourier_transform_magnitude[:N // 2] > threshold)[0]
-
-        if significant_indices.size == 0:
-            print("No significant frequency components found.")
+    def plot_frequency(self, bandwidth, sampling_frequency):
+        if bandwidth is None:
+            logger.info("No significant frequency components found.")
             return
+        max_frequency, max_magnitude = bandwidth
 
-        # Step 4: Find the highest frequency among significant components
-        max_index = significant_indices[-1]  # Get the index of the highest frequency component
-        max_frequency = freq[max_index]
-        max_magnitude = fourier_transform_magnitude[max_index]
-
-        # Step 5: Prepare for plotting
-        self.freq_viewer.clear()
+        # The original band and its repetitions at fs and 2fs, drawn as line segments (pairs of points)
+        offsets = np.arange(3) * sampling_frequency
+        left = offsets - max_frequency
+        right = offsets + max_frequency
 
-        # Plot the original rectangle for the fundamental frequency
-        self.freq_viewer.plot(
-            [-max_frequency, max_frequency],  # Horizontal line connecting -w and +w
-            [max_magnitude, max_magnitude],  # Constant magnitude
-            pen='r'
-        )
-
-        # Plot impulses at -w and +w for the original signal
-        self.freq_viewer.plot([-max_frequency, -max_frequency], [0, max_magnitude], pen='b')  # Vertical at -w
-        self.freq_viewer.plot([max_frequency, max_frequency], [0, max_magnitude], pen='b')  # Vertical at +w
-
-        # Step 6: Repeat the spectrum for fs and 2fs
-        for k in range(1, 3):  # Repeat for fs and 2fs
-            offset = k * self.sampling_frequency
+        # Horizontal line connecting -w and +w at the band magnitude
+        band_x = np.column_stack([left, right]).ravel()
+        band_y = np.full(len(band_x), max_magnitude)
+        self.bandwidth_plot.setData(band_x, band_y)
 
-            # Draw rectangle for repetition
-            self.freq_viewer.plot(
-                [-max_frequency + offset, max_frequency + offset],  # Shifted horizontal line
-                [max_magnitude, max_magnitude],  # Constant magnitude
-                pen='r'
-            )
+        # Impulses at -w and +w
+        impulse_x = np.repeat(np.column_stack([left, right]).ravel(), 2)
+        impulse_y = np.tile([0, max_magnitude], len(impulse_x) // 2)
+        self.impulse_plot.setData(impulse_x, impulse_y)
 
-            # Draw impulses for repetition
-            self.freq_viewer.plot([-max_frequency + offset, -max_frequency + offset], [0, max_magnitude],
-                                  pen='b')  # Vertical at -w + offset
-            self.freq_viewer.plot([max_frequency + offset, max_frequency + offset], [0, max_magnitude],
-                                  pen='b')  # Vertical at +w + offset
+    def plot_spectrum(self, spectrum, sampling_frequency, rebuild=True):
+        """
+        Draw the magnitude spectrum and its images at multiples of the sampling frequency
 
-        # Show the grid
-        self.freq_viewer.showGrid(x=True, y=True)
+        Args:
+            spectrum (tuple): Two-sided frequencies and magnitudes
+            sampling_frequency (float): Sampling frequency in Hz
+            rebuild (bool): Rebuild the min/max pyramid; when only fs changed, the
+                cached one is reused and the images are just shifted
+        """
+        if rebuild:
+            pyramid = MinMaxPyramid(*spectrum)
+            self.spectrum_plot.lod_pyramid = pyramid
+            for curve in self.spectrum_replicas.values():
+                curve.lod_pyramid = pyramid
+        for k, curve in self.spectrum_replicas.items():
+            curve.lod_offset = k * sampling_frequency
+        self.refresh_lod(self.freq_viewer)
+
+    def open_sweep_window(self):
+        if self.sweep_window is None:
+            self.sweep_window = SweepWindow(self.signal_manager)
+        self.sweep_window.show()
+        self.sweep_window.raise_()
+
+    def closeEvent(self, event):
+        if self.sweep_window is not None:
+            self.sweep_window.close()
+        self.recompute_scheduler.wait_for_done()
+        self.compare_scheduler.wait_for_done()
+        self.method_comparison.shutdown()
+        self.signal_manager.buffers.close()
+        super().closeEvent(event)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:  # If 'Esc' key is pressed
@@ -959,6 +1282,7 @@ class GUI(QWidget):
 
 
 if __name__ == "__main__":
+    configure_logging()
     app = QApplication(sys.argv)
     main_window = GUI()
     main_window.show()
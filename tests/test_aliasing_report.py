@@ -0,0 +1,28 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task2 import Signal, SignalManager
+from timebase import UniformTimeBase
+
+
+def uploaded_signal(signal_id, components, frequency=None):
+    time = UniformTimeBase(0.0, 0.01, 100)
+    return Signal(name=f"upload-{signal_id}", amplitude=[0.0] * 100, time=time, signal_id=signal_id,
+                  signal_type="UPLOADED", frequency=frequency, components=components)
+
+
+def test_text_component_frequencies_are_skipped():
+    manager = SignalManager(plot_callback=lambda: None)
+    manager.signals = [
+        uploaded_signal(1, [{"name": "a", "frequency": "3 Hz", "amplitude": "loud"},
+                            {"name": "b", "frequency": 7.0, "amplitude": 1.0}]),
+        uploaded_signal(2, [], frequency="five"),
+    ]
+
+    report = manager.aliasing_report(10.0)
+
+    assert [component["name"] for component in report["components"]] == ["b"]
+    assert report["components"][0]["alias"] == 3.0
+    manager.buffers.close()
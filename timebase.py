@@ -0,0 +1,134 @@
+import numpy as np
+
+
+class UniformTimeBase:
+    """
+    Evenly spaced time instants start + k * step, for k = 0 .. length - 1
+
+    Stands in for a materialized time array: indexing, slicing and searchsorted()
+    are computed from the three numbers, so a signal or a reconstruction on a
+    uniform grid does not hold a float64 array of its instants. Slicing returns
+    another UniformTimeBase, and NumPy functions that need the actual values get
+    them through __array__, computed on demand. Non-uniform data keeps using plain
+    arrays; every consumer accepts both.
+    """
+
+    def __init__(self, start, step, length):
+        """
+        Args:
+            start (float): First instant
+            step (float): Spacing between instants
+            length (int): Number of instants
+        """
+        self.start = float(start)
+        self.step = float(step)
+        self.length = int(length)
+
+    @classmethod
+    def linspace(cls, start, stop, num):
+        """Time base of np.linspace(start, stop, num)."""
+        step = (stop - start) / (num - 1) if num > 1 else 0.0
+        return cls(start, step, num)
+
+    @classmethod
+    def from_array(cls, time, rtol=1e-6, block_size=1 << 20):
+        """
+        Return the time base of an evenly spaced array, or None
+
+        The spacing is checked block by block so no full-size temporary is allocated.
+        """
+        length = len(time)
+        if length < 2:
+            return None
+        step = (time[-1] - time[0]) / (length - 1)
+        if step <= 0:
+            return None
+        for start in range(0, length - 1, block_size):
+            block = np.diff(time[start:start + block_size + 1])
+            if np.any(np.abs(block - step) > rtol * step):
+                return None
+        return cls(time[0], step, length)
+
+    @property
+    def end(self):
+        """Last instant."""
+        return self.start + (self.length - 1) * self.step
+
+    @property
+    def sample_rate(self):
+        return 1 / self.step
+
+    @property
+    def shape(self):
+        return (self.length,)
+
+    @property
+    def nbytes(self):
+        """Size of the array this time base stands in for."""
+        return self.length * np.dtype(float).itemsize
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            indices = range(*key.indices(self.length))
+            return UniformTimeBase(self.start + indices.start * self.step, self.step * indices.step, len(indices))
+        if isinstance(key, (int, np.integer)):
+            index = key + self.length if key < 0 else key
+            if not 0 <= index < self.length:
+                raise IndexError(f"index {key} is out of bounds for a time base of length {self.length}")
+            return self.start + index * self.step
+        return self.start + np.arange(self.length)[key] * self.step
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.start + np.arange(self.length) * self.step
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def searchsorted(self, values, side="left", sorter=None):
+        """
+        Same as np.searchsorted on the materialized instants, without building them
+
+        np.searchsorted(time_base, ...) dispatches here. sorter is accepted for that
+        signature and ignored, the instants are always sorted.
+        """
+        values = np.asarray(values, dtype=float)
+        if self.length < 2 or self.step == 0:
+            index = (values > self.start) if side == "left" else (values >= self.start)
+            index = index.astype(np.intp) * self.length
+        else:
+            position = (values - self.start) / self.step
+            # Instants that match up to rounding count as equal, like they would in the array
+            nearest = np.rint(position)
+            position = np.where(np.abs(position - nearest) <= 1e-9 * np.maximum(np.abs(nearest), 1),
+                                nearest, position)
+            index = np.ceil(position) if side == "left" else np.floor(position) + 1
+            index = np.clip(index, 0, self.length).astype(np.intp)
+        return index if index.ndim else int(index)
+
+    def __eq__(self, other):
+        if not isinstance(other, UniformTimeBase):
+            return NotImplemented
+        return (self.start, self.step, self.length) == (other.start, other.step, other.length)
+
+    def __hash__(self):
+        return hash((self.start, self.step, self.length))
+
+    def __repr__(self):
+        return f"UniformTimeBase(start={self.start!r}, step={self.step!r}, length={self.length!r})"
+
+
+def as_time_base(time):
+    """Return a UniformTimeBase for evenly spaced instants, else the instants as an array."""
+    if isinstance(time, UniformTimeBase):
+        return time
+    time = np.asarray(time, dtype=float)
+    uniform = UniformTimeBase.from_array(time)
+    return time if uniform is None else uniform
+
+
+def time_step(time):
+    """Spacing of a uniform time base or of an evenly spaced array."""
+    if isinstance(time, UniformTimeBase):
+        return time.step
+    return time[1] - time[0]